@@ -0,0 +1,46 @@
+"""Add an HNSW index on chunk embeddings for approximate nearest-neighbor search.
+
+Vector search ordered by cosine distance was an exact sequential scan over
+every stored embedding, and multi-angle retrieval repeats that scan once per
+search angle. An HNSW index (pgvector >= 0.5) makes each lookup sub-linear.
+Recall is tuned at query time via hnsw.ef_search; very large result requests
+disable the index scan and stay exact.
+
+Revision ID: 20260801_0012
+Revises: 20260721_0011
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20260801_0012"
+down_revision = "20260721_0011"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_chunk_embeddings_embedding_hnsw"
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    # On SQLite (the test suite) the column is plain JSON and has no ANN index.
+    if not _is_postgres():
+        return
+
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON chunk_embeddings "
+        "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    if not _is_postgres():
+        return
+
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,48 @@
+"""Add a binary-quantized HNSW index on chunk embeddings.
+
+Backs the optional KARL_PGVECTOR_BINARY_QUANT search mode: candidates are
+shortlisted by Hamming distance over 1-bit codes (32x smaller than float
+vectors) and then reranked with exact cosine similarity in the retriever.
+Requires pgvector >= 0.7 for binary_quantize().
+
+Revision ID: 20260801_0013
+Revises: 20260801_0012
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20260801_0013"
+down_revision = "20260801_0012"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_chunk_embeddings_embedding_bit_hnsw"
+# Must match CHUNK_EMBEDDING_DIM as of this revision (the retriever's query
+# casts to the same width so Postgres can use the index).
+EMBEDDING_DIM = 768
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    # On SQLite (the test suite) the column is plain JSON and has no ANN index.
+    if not _is_postgres():
+        return
+
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON chunk_embeddings "
+        f"USING hnsw ((binary_quantize(embedding)::bit({EMBEDDING_DIM})) bit_hamming_ops)"
+    )
+
+
+def downgrade() -> None:
+    if not _is_postgres():
+        return
+
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
@@ -39,6 +39,7 @@ from backend.config import (
     LLM_MODEL,
     MANIFESTS_DIR,
     HYBRID_VECTOR_WEIGHT,
+    RETRIEVAL_PRELOAD_ON_STARTUP,
 )
 from backend.contracts import (
     list_contract_catalog,
@@ -2819,7 +2820,16 @@ async def lifespan(app: FastAPI):
         print(f"Tenant database configured: {_safe_db_url}")
     else:
         print("Warning: KARL_POSTGRES_URL is not set. Tenant member/admin workspaces will be unavailable.")
-    if _legacy_contract_pipeline_enabled():
+    if _legacy_contract_pipeline_enabled() and RETRIEVAL_PRELOAD_ON_STARTUP:
+        legacy_retriever = _ensure_legacy_retriever()
+        default_contract_id = resolve_default_contract_id()
+        if legacy_retriever is not None and default_contract_id:
+            try:
+                legacy_retriever.preload(default_contract_id)
+                print("Legacy contract retrieval stack preloaded.")
+            except Exception as exc:
+                print(f"Warning: Legacy retrieval preload failed: {exc}")
+    elif _legacy_contract_pipeline_enabled():
         print("Legacy contract retrieval stack set to lazy initialization.")
     else:
         print("Legacy contract retrieval stack disabled for startup.")
@@ -4,12 +4,22 @@ Chunk artifact path helpers.
 Resolves per-contract chunk files first, then shared fallback files.
 """
 
+import json
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from backend.config import CHUNKS_DIR, MANIFESTS_DIR
 from backend.effective_contracts import resolve_effective_index_input
 
+# Lazy-loaded optional dependency (faster JSON decoding); see _load_orjson().
+orjson = None
+_orjson_checked = False
+
+# Parsed JSON artifacts keyed by path -> ((mtime_ns, size), payload).
+_ARTIFACT_PAYLOAD_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+_ARTIFACT_PAYLOAD_LOCK = threading.Lock()
+
 
 def candidate_chunk_files(contract_id: Optional[str] = None) -> list[Path]:
     """Return candidate chunk files in priority order."""
@@ -81,3 +91,74 @@ def resolve_chunk_file(
         if path.exists():
             return path
     return None
+
+
+def _load_orjson():
+    """Lazy load orjson, falling back to stdlib json when unavailable."""
+    global orjson, _orjson_checked
+    if not _orjson_checked:
+        _orjson_checked = True
+        try:
+            # orjson resolves uuid at init and crashes if that import fails
+            # (e.g. stdlib `platform` shadowed by backend/platform when a
+            # backend/ script is run directly), so probe it first.
+            import uuid  # noqa: F401
+            import orjson as _orjson
+        except Exception:
+            _orjson = None
+        orjson = _orjson
+    return orjson
+
+
+def load_chunk_payload(chunks_file: Path) -> Any:
+    """
+    Parse a chunk artifact once per process and share the decoded payload.
+
+    See load_json_artifact(); the payload is shared between callers, so treat
+    it as read-only and copy rows before mutating them.
+    """
+    return load_json_artifact(chunks_file)
+
+
+def load_json_artifact(path: Path) -> Any:
+    """
+    Parse a JSON artifact (chunks, wage or entitlement tables) once per process.
+
+    Uses orjson when installed (bytes-based, several times faster than stdlib
+    json on large enriched-chunk files). The cache is keyed by file path and
+    invalidated when the file's mtime/size changes, so rebuilt artifacts are
+    picked up without a restart.
+
+    The returned payload is shared between callers: treat it as read-only.
+    """
+    path = Path(path)
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = str(path.resolve())
+    cached = _ARTIFACT_PAYLOAD_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _ARTIFACT_PAYLOAD_LOCK:
+        # Another thread may have parsed the file while we waited.
+        cached = _ARTIFACT_PAYLOAD_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        payload = parse_json_file(path)
+        _ARTIFACT_PAYLOAD_CACHE[cache_key] = (signature, payload)
+        return payload
+
+
+def parse_json_file(path: Path) -> Any:
+    """
+    Parse a JSON file into a fresh (caller-owned) object.
+
+    Uses orjson when installed and falls back to stdlib json. Use this over
+    load_json_artifact() when the caller mutates the result.
+    """
+    fast_json = _load_orjson()
+    if fast_json is not None:
+        return fast_json.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
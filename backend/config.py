@@ -53,7 +53,40 @@ CONTRACT_JSON_FILE = PROJECT_ROOT / "SW+Pueblo+Clerks+2022.2025.json"
 # Vector DB settings
 CHROMA_PERSIST_DIR = DATA_DIR / "chroma_db"
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"  # Local model, no API needed
+# Sentence-transformers inference backend: "torch" (default) or "onnx" / "openvino"
+# (sentence-transformers >= 3.2 plus the matching runtime). ONNX Runtime is
+# several times faster on CPU, more so with a quantized export such as
+# "onnx/model_qint8_avx512_vnni.onnx". Quantized vectors differ slightly from
+# torch ones, so rebuild the vector index after switching.
+EMBEDDING_BACKEND = os.getenv("KARL_EMBEDDING_BACKEND", "torch").strip().lower() or "torch"
+EMBEDDING_MODEL_FILE = os.getenv("KARL_EMBEDDING_MODEL_FILE", "").strip()  # e.g. onnx/model_qint8_avx512_vnni.onnx
+EMBEDDING_DEVICE = os.getenv("KARL_EMBEDDING_DEVICE", "").strip()  # cuda/mps/cpu; empty = first available
 COLLECTION_NAME = "union_contracts"
+# Chroma HNSW parameters, applied when a collection is created. The corpus is
+# built in bulk and then read-heavy: a lower construction_ef speeds index
+# builds, and a search_ef well above Chroma's default of 10 keeps recall.
+CHROMA_HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 64,
+    "hnsw:search_ef": 64,
+    "hnsw:batch_size": 100,
+    "hnsw:sync_threshold": 1000,
+}
+EMBEDDING_CACHE_MAX_ENTRIES = 4096    # In-process LRU of query embeddings
+EMBEDDING_CACHE_TTL_SECONDS = 3600    # Expire cached query embeddings after 1h
+EMBEDDING_ENCODE_BATCH_SIZE = 64      # Chunks per encoder forward pass when indexing
+# On-disk chunk embedding cache: index rebuilds only encode new or edited
+# chunks. Used by both vector backends, so it lives outside the Chroma dir.
+EMBEDDING_DISK_CACHE_ENABLED = os.getenv("KARL_EMBEDDING_DISK_CACHE", "0") == "1"
+EMBEDDING_DISK_CACHE_FILE = Path(
+    os.getenv("KARL_EMBEDDING_DISK_CACHE_FILE", str(DATA_DIR / "embedding_cache.sqlite"))
+)
+EMBEDDING_DISK_CACHE_MAX_ROWS = 100_000  # Least recently used vectors are pruned above this
+PGVECTOR_HNSW_EF_SEARCH = 100         # HNSW candidate list size per pgvector query (recall knob)
+PGVECTOR_EXACT_SEARCH_ABOVE = 100     # Bypass the HNSW index (exact scan) above this many candidates
+PGVECTOR_BINARY_QUANTIZATION = os.getenv("KARL_PGVECTOR_BINARY_QUANT", "0") == "1"  # Hamming prefilter, FP32 rerank
+PGVECTOR_BINARY_RERANK_FACTOR = 4     # Binary candidates fetched per final candidate before FP32 rerank
 
 # LLM settings
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
@@ -104,6 +137,38 @@ INTERPRETER_TIMEOUT_MS = 15000         # Timeout for interpretation (15s)
 MULTI_QUERY_MAX_SEARCHES = 3           # Max number of search angles to try
 MULTI_QUERY_RESULTS_PER_SEARCH = 5     # Results per search angle
 MULTI_QUERY_TOTAL_RESULTS = 10         # Total unique results after merging
+MULTI_QUERY_MAX_WORKERS = 8            # Max search angles retrieved concurrently
+
+# Semantic retrieval cache: reuse a recent retrieve() result when a new query
+# embeds within RETRIEVAL_SEMANTIC_CACHE_THRESHOLD cosine of a cached one and
+# routes identically (same intent, classification, topic, numbers, tenure).
+RETRIEVAL_SEMANTIC_CACHE_ENABLED = os.getenv("KARL_RETRIEVAL_SEMANTIC_CACHE", "0") == "1"
+RETRIEVAL_SEMANTIC_CACHE_THRESHOLD = 0.95
+RETRIEVAL_SEMANTIC_CACHE_MAX_ENTRIES = 256
+RETRIEVAL_SEMANTIC_CACHE_TTL_SECONDS = 600
+
+# Exact retrieval cache: reuse a retrieve() result when the same query text is
+# asked again with identical routing. Checked before the semantic cache and
+# needs no query embedding.
+RETRIEVAL_RESULT_CACHE_ENABLED = os.getenv("KARL_RETRIEVAL_RESULT_CACHE", "0") == "1"
+RETRIEVAL_RESULT_CACHE_MAX_ENTRIES = 512
+RETRIEVAL_RESULT_CACHE_TTL_SECONDS = 300
+
+# Vector-search semantic cache: reuse a recent vector-store search() result
+# when the query embeds within VECTOR_SEARCH_SEMANTIC_CACHE_THRESHOLD cosine of
+# a cached query searched with identical filters and article/section refs.
+VECTOR_SEARCH_SEMANTIC_CACHE_ENABLED = os.getenv("KARL_VECTOR_SEARCH_SEMANTIC_CACHE", "0") == "1"
+VECTOR_SEARCH_SEMANTIC_CACHE_THRESHOLD = 0.97
+VECTOR_SEARCH_SEMANTIC_CACHE_MAX_ENTRIES = 128
+VECTOR_SEARCH_SEMANTIC_CACHE_TTL_SECONDS = 600
+
+# Warm start: build the legacy retriever and run HybridRetriever.preload() at
+# API startup instead of on the first contract question.
+RETRIEVAL_PRELOAD_ON_STARTUP = os.getenv("KARL_RETRIEVAL_PRELOAD", "0") == "1"
+
+# Session profiles are kept in memory only; above this many sessions the least
+# recently used profile is dropped.
+USER_PROFILE_MAX_SESSIONS = int(os.getenv("KARL_USER_PROFILE_MAX_SESSIONS", "10000"))
 
 # =============================================================================
 # LLM Reranker Configuration (Phase 5)
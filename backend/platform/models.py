@@ -11,6 +11,11 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.platform.db import Base
 
+# Width of chunk_embeddings.embedding. The binary-quantized HNSW index
+# (migration 20260801_0013) and the retriever's Hamming query cast to
+# bit(CHUNK_EMBEDDING_DIM); Postgres only uses the index when they match.
+CHUNK_EMBEDDING_DIM = 768
+
 try:
     from pgvector.sqlalchemy import Vector
 except Exception:  # pragma: no cover - pgvector optional in non-production tests
@@ -274,7 +279,7 @@ class ChunkEmbedding(Base):
         # Must equal KARL_EMBEDDING_DIMENSIONS. 768 is a documented output
         # width for gemini-embedding-001; changing one without the other, or
         # without a migration, breaks inserts at ingest time.
-        embedding: Mapped[list[float] | None] = mapped_column(Vector(768))
+        embedding: Mapped[list[float] | None] = mapped_column(Vector(CHUNK_EMBEDDING_DIM))
     else:  # pragma: no cover - used only when pgvector unavailable
         embedding: Mapped[list[float] | None] = mapped_column(JSON)
 
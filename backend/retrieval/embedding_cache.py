@@ -0,0 +1,128 @@
+"""
+Persistent Chunk Embedding Cache - Skips re-embedding unchanged chunks.
+
+Rebuilding an index (build_index with clear_existing=True) re-encodes every
+chunk, even though almost all chunk texts are unchanged between runs and
+encoding dominates add_chunks. This cache keeps each chunk embedding in a
+small SQLite file keyed by SHA-256(embedding model + text), so a rebuild only
+encodes new or edited chunks.
+
+Vectors are stored as float32, the encoder's own precision, so a cached
+vector is identical to a freshly encoded one. The file is bounded: above
+max_rows, the least recently used vectors are pruned on write.
+"""
+
+import hashlib
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+from typing import Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.config import EMBEDDING_DISK_CACHE_MAX_ROWS, EMBEDDING_MODEL
+
+# Hashes per SELECT ... IN (...) lookup (SQLite caps bound parameters).
+_LOOKUP_BATCH_SIZE = 500
+
+
+def _pack(embedding) -> bytes:
+    """float32 bytes for a list of floats or an encoder float32 array."""
+    if getattr(embedding, "dtype", None) == "float32":
+        return embedding.tobytes()
+    return array("f", embedding).tobytes()
+
+
+class PersistentEmbeddingCache:
+    """SQLite-backed LRU map of sha256(model, text) -> float32 embedding."""
+
+    def __init__(
+        self,
+        path: Path,
+        model_name: str = EMBEDDING_MODEL,
+        max_rows: int = EMBEDDING_DISK_CACHE_MAX_ROWS,
+    ):
+        self.path = Path(path)
+        self.model_name = model_name
+        self.max_rows = max_rows
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "hash TEXT PRIMARY KEY, vec BLOB NOT NULL, used_at INTEGER NOT NULL DEFAULT 0)"
+                )
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(embeddings)")}
+                if "used_at" not in columns:
+                    conn.execute("ALTER TABLE embeddings ADD COLUMN used_at INTEGER NOT NULL DEFAULT 0")
+                conn.execute("CREATE INDEX IF NOT EXISTS ix_embeddings_used_at ON embeddings (used_at)")
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: list[str]) -> list[Optional[list]]:
+        """Return the cached embedding for each text, or None on a miss."""
+        keys = [self._key(text) for text in texts]
+        found: dict[str, list] = {}
+        now = time.time_ns()
+        conn = self._connect()
+        try:
+            with conn:
+                for i in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+                    batch = keys[i:i + _LOOKUP_BATCH_SIZE]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vec = array("f")
+                        vec.frombytes(blob)
+                        found[key] = vec.tolist()
+                    if rows:
+                        # Hits count as uses, so pruning keeps live chunks.
+                        conn.execute(
+                            f"UPDATE embeddings SET used_at = ? WHERE hash IN ({placeholders})",
+                            [now, *batch],
+                        )
+        finally:
+            conn.close()
+        return [found.get(key) for key in keys]
+
+    def put_many(self, texts: list[str], embeddings: list) -> None:
+        """Store one embedding per text, replacing any previous entry."""
+        now = time.time_ns()
+        rows = [
+            (self._key(text), _pack(embedding), now)
+            for text, embedding in zip(texts, embeddings)
+        ]
+        if not rows:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)", rows)
+                excess = int(conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]) - self.max_rows
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM embeddings WHERE hash IN "
+                        "(SELECT hash FROM embeddings ORDER BY used_at, rowid LIMIT ?)",
+                        (excess,),
+                    )
+        finally:
+            conn.close()
+
+    def count(self) -> int:
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0])
+        finally:
+            conn.close()
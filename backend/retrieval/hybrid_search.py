@@ -10,21 +10,25 @@ Designed for scalability across 100+ union contracts.
 """
 
 import re
-import json
 import math
+import heapq
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 from dataclasses import dataclass
+from operator import itemgetter
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from backend.config import TOP_K_RESULTS, BM25_K1, BM25_B, MANIFESTS_DIR
 from backend.retrieval.query_expansion import expand_query, get_keyword_variants
-from backend.chunk_files import resolve_chunk_file
+from backend.chunk_files import load_chunk_payload, resolve_chunk_file
 from backend.concept_index_files import resolve_concept_index_file
 from backend.contracts import resolve_contract_region_id
 
+# Sort key for (chunk_id, score) rankings.
+_SCORE_KEY = itemgetter(1)
+
 # Phase 4: Concept index for vocabulary bridging
 _concept_index_cache: dict[str, object] = {}
 
@@ -109,6 +113,7 @@ class BM25Index:
         self.avg_doc_length: float = 0.0
         self.term_doc_freq: Dict[str, int] = defaultdict(int)  # term -> num docs containing it
         self.term_freq: Dict[str, Dict[str, int]] = defaultdict(dict)  # term -> {chunk_id: count}
+        self.doc_positions: Dict[str, int] = {}  # chunk_id -> index order (breaks score ties)
         self.num_docs: int = 0
     
     def _tokenize(self, text: str) -> List[str]:
@@ -131,6 +136,7 @@ class BM25Index:
         self.doc_lengths = {}
         self.term_doc_freq = defaultdict(int)
         self.term_freq = defaultdict(dict)
+        self.doc_positions = {}
         
         total_length = 0
         
@@ -146,6 +152,7 @@ class BM25Index:
             )
             
             self.documents[chunk_id] = chunk
+            self.doc_positions.setdefault(chunk_id, len(self.doc_positions))
             tokens = self._tokenize(searchable_text)
             self.doc_lengths[chunk_id] = len(tokens)
             total_length += len(tokens)
@@ -222,17 +229,32 @@ class BM25Index:
         if not query_terms:
             return []
         
-        # Score all documents
-        scores = []
-        for chunk_id in self.documents:
-            score = self.score_document(chunk_id, query_terms)
-            if score > 0:
-                scores.append((chunk_id, score))
-        
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
-        
-        return scores[:n_results]
+        # Score term-at-a-time over each term's postings, so only documents
+        # containing a query term are touched. Per document, contributions
+        # are summed in query-term order, exactly as score_document() does.
+        doc_scores: Dict[str, float] = {}
+        saturation = self.k1 + 1
+        for term in query_terms:
+            postings = self.term_freq.get(term)
+            if not postings:
+                continue
+            idf = self._idf(term)
+            for chunk_id, tf in postings.items():
+                doc_len = self.doc_lengths.get(chunk_id)
+                if doc_len is None:
+                    continue
+                numerator = tf * saturation
+                denominator = tf + self.k1 * (1 - self.b + self.b * (doc_len / self.avg_doc_length))
+                doc_scores[chunk_id] = doc_scores.get(chunk_id, 0.0) + idf * (numerator / denominator)
+
+        # Top-k by score descending; ties keep index order, matching a
+        # stable sort over all documents.
+        positions = self.doc_positions
+        return heapq.nlargest(
+            n_results,
+            ((chunk_id, score) for chunk_id, score in doc_scores.items() if score > 0),
+            key=lambda item: (item[1], -positions[item[0]]),
+        )
 
 
 # =============================================================================
@@ -274,7 +296,7 @@ def reciprocal_rank_fusion(
             rrf_scores[doc_id] += weight / (k + rank)
     
     # Sort by RRF score descending
-    sorted_results = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
+    sorted_results = sorted(rrf_scores.items(), key=_SCORE_KEY, reverse=True)
     
     return sorted_results
 
@@ -312,8 +334,7 @@ class HybridSearcher:
         if chunks_file is None:
             chunks_file = resolve_chunk_file(contract_id=None, allow_shared_fallback=True)
         if chunks_file and chunks_file.exists():
-            with open(chunks_file, 'r', encoding='utf-8') as f:
-                chunks = json.load(f)
+            chunks = load_chunk_payload(chunks_file)
             chunks = self._ensure_unique_chunk_ids(chunks)
             if self._custom_chunks_source:
                 self._source_chunks = chunks
@@ -354,6 +375,13 @@ class HybridSearcher:
             normalized.append(c)
         return normalized
 
+    def warm_up(self, contract_id: Optional[str] = None, region_id: Optional[str] = None) -> None:
+        """Build (and cache) a contract's BM25 index and concept index ahead of the first search."""
+        if contract_id:
+            region_id = str(region_id or resolve_contract_region_id(contract_id))
+        self._get_bm25_resources(contract_id, region_id)
+        get_concept_index(contract_id)
+
     def _get_bm25_resources(
         self,
         contract_id: Optional[str],
@@ -375,8 +403,7 @@ class HybridSearcher:
         else:
             chunks_file = resolve_chunk_file(contract_id=contract_id, allow_shared_fallback=True)
             if chunks_file and chunks_file.exists():
-                with open(chunks_file, "r", encoding="utf-8") as f:
-                    raw_chunks = json.load(f)
+                raw_chunks = load_chunk_payload(chunks_file)
         if raw_chunks:
             allow_unscoped = self._allow_legacy_unscoped_chunks()
             for c in raw_chunks:
@@ -501,6 +528,13 @@ class HybridSearcher:
                 seen.add(art)
 
         return combined[:5]  # Return top 5 articles to boost
+
+    @staticmethod
+    def semantic_query(query: str, use_expansion: bool = True) -> str:
+        """Return the text search() sends to the vector store for `query`."""
+        if use_expansion:
+            return expand_query(query).combined_query
+        return query
     
     def search(
         self,
@@ -560,11 +594,7 @@ class HybridSearcher:
                 boost_articles = concept_boost_articles
 
         # 1. Expand query if enabled
-        if use_expansion:
-            expanded = expand_query(query)
-            semantic_query = expanded.combined_query
-        else:
-            semantic_query = query
+        semantic_query = self.semantic_query(query, use_expansion)
         
         # 2. Vector/Semantic Search
         # Get more results than needed for better fusion
@@ -617,11 +647,12 @@ class HybridSearcher:
         
         # 4.5. Apply topic-based article boosting to RRF scores
         if boost_articles:
+            boost_article_set = set(boost_articles)
             boosted_ranking = []
             for chunk_id, rrf_score in rrf_ranking:
                 chunk = chunks_by_id.get(chunk_id, {})
                 article_num = chunk.get('article_num', 0)
-                if article_num in boost_articles:
+                if article_num in boost_article_set:
                     # Significant boost (doubles typical RRF score) to ensure
                     # topic-relevant articles appear in results
                     rrf_score += 0.08
@@ -629,7 +660,7 @@ class HybridSearcher:
                     # Light penalty for non-topic articles when explicit topic boosts exist.
                     rrf_score -= 0.01
                 boosted_ranking.append((chunk_id, rrf_score))
-            rrf_ranking = sorted(boosted_ranking, key=lambda x: x[1], reverse=True)
+            rrf_ranking = sorted(boosted_ranking, key=_SCORE_KEY, reverse=True)
 
         # 4.6. Side-letter lexical boost for LOA/LOU prompts and follow-ups
         side_letter_mode = self._side_letter_query_mode(query)
@@ -663,7 +694,7 @@ class HybridSearcher:
                     if any(sig in blob for sig in ("written notice", "30 days", "either party", "discontinue")):
                         boost += 0.05
                 side_letter_boosted.append((chunk_id, rrf_score + boost))
-            rrf_ranking = sorted(side_letter_boosted, key=lambda x: x[1], reverse=True)
+            rrf_ranking = sorted(side_letter_boosted, key=_SCORE_KEY, reverse=True)
 
         # 4.7. Structured-table evidence boost for value-heavy queries
         if self._query_requests_structured_values(query):
@@ -688,7 +719,7 @@ class HybridSearcher:
                         rrf_score += 0.02
 
                 table_boosted_ranking.append((chunk_id, rrf_score))
-            rrf_ranking = sorted(table_boosted_ranking, key=lambda x: x[1], reverse=True)
+            rrf_ranking = sorted(table_boosted_ranking, key=_SCORE_KEY, reverse=True)
         
         # 5. Build SearchResult objects
         results = []
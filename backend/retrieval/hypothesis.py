@@ -14,6 +14,7 @@ These titles are used to:
 2. Boost chunks whose article_title matches any hypothesis
 """
 
+import threading
 import time
 from typing import List, Optional
 from dataclasses import dataclass
@@ -258,13 +259,16 @@ def apply_title_boosting(
 
 # Module-level singleton for reuse
 _hypothesis_generator = None
+_hypothesis_generator_lock = threading.Lock()
 
 
 def get_hypothesis_generator() -> HypothesisGenerator:
     """Get or create the hypothesis generator singleton."""
     global _hypothesis_generator
     if _hypothesis_generator is None:
-        _hypothesis_generator = HypothesisGenerator()
+        with _hypothesis_generator_lock:
+            if _hypothesis_generator is None:
+                _hypothesis_generator = HypothesisGenerator()
     return _hypothesis_generator
 
 
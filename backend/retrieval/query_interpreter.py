@@ -72,6 +72,10 @@ class QueryInterpretation:
     # Suggested contract sections/topics
     likely_sections: List[str] = field(default_factory=list)
 
+    # Routing intent (router.QueryIntent) resolved for this query; filled in
+    # by the retriever so downstream stages don't classify a second time.
+    routed_intent: Optional[Any] = None
+
     # Metadata
     latency_ms: float = 0
     success: bool = True
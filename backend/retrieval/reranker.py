@@ -18,6 +18,7 @@ import time
 import re
 import json
 import logging
+import threading
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
 
@@ -116,6 +117,13 @@ class LLMReranker:
                 return
             logger.warning("google-genai not installed")
 
+    def warm_up(self):
+        """Create the Gemini client ahead of the first rerank call."""
+        try:
+            self._ensure_client()
+        except Exception as e:
+            logger.warning(f"Reranker warm-up failed: {e}")
+
     def _generate_scores_text(self, prompt: str) -> str:
         """Generate Gemini response text using whichever SDK is installed."""
         if self._client_kind == "google-genai":
@@ -358,13 +366,16 @@ class LLMReranker:
 
 # Module-level singleton
 _reranker = None
+_reranker_lock = threading.Lock()
 
 
 def get_reranker() -> LLMReranker:
     """Get or create the reranker singleton."""
     global _reranker
     if _reranker is None:
-        _reranker = LLMReranker()
+        with _reranker_lock:
+            if _reranker is None:
+                _reranker = LLMReranker()
     return _reranker
 
 
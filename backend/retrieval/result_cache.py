@@ -0,0 +1,85 @@
+"""
+Exact Retrieval Cache - Reuses retrieve() results for repeated questions.
+
+Chat follow-ups, retries and evaluation loops often send the exact same
+question with the exact same routing. This cache maps (query text, routing
+scope) to the stored result, so a repeat skips search, fusion and expansion
+without embedding the query (the semantic cache needs an embedding to look
+anything up).
+
+Entries expire after a TTL and the least recently used entry is evicted when
+the cache is full.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.config import (
+    RETRIEVAL_RESULT_CACHE_MAX_ENTRIES,
+    RETRIEVAL_RESULT_CACHE_TTL_SECONDS,
+)
+
+
+class RetrievalResultCache:
+    """Bounded LRU of key -> (stored_at, result) with a TTL and hit statistics."""
+
+    def __init__(
+        self,
+        maxsize: int = RETRIEVAL_RESULT_CACHE_MAX_ENTRIES,
+        ttl: float = RETRIEVAL_RESULT_CACHE_TTL_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the unexpired result stored under `key`, if any."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[1]
+        return copy.deepcopy(result)
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """Store a private copy of `result` under `key`."""
+        entry = (time.monotonic(), copy.deepcopy(result))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
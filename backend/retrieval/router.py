@@ -8,11 +8,15 @@ Routes:
 """
 
 import re
+import copy
 import json
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -24,9 +28,14 @@ from backend.config import (
     FULL_ARTICLE_MIN_TOP_K_MATCH,
     CAG_ENABLE_QUERY_INTERPRETER, MULTI_QUERY_MAX_SEARCHES,
     MULTI_QUERY_RESULTS_PER_SEARCH, MULTI_QUERY_TOTAL_RESULTS,
-    CAG_ENABLE_RERANKER, MANIFESTS_DIR, CONTRACT_ID
+    MULTI_QUERY_MAX_WORKERS, CAG_ENABLE_RERANKER,
+    RETRIEVAL_SEMANTIC_CACHE_ENABLED, RETRIEVAL_RESULT_CACHE_ENABLED,
+    MANIFESTS_DIR, CONTRACT_ID
 )
 from backend.retrieval.vector_store import ContractVectorStore
+from backend.retrieval.hybrid_search import HybridSearcher
+from backend.retrieval.semantic_cache import SemanticQueryCache
+from backend.retrieval.result_cache import RetrievalResultCache
 from backend.retrieval.hypothesis import (
     get_hypothesis_generator,
     apply_title_boosting,
@@ -36,9 +45,14 @@ from backend.retrieval.query_interpreter import (
     get_interpreter,
     QueryInterpretation
 )
-from backend.chunk_files import resolve_chunk_file
+from backend.retrieval.reranker import get_reranker
+from backend.chunk_files import load_chunk_payload, load_json_artifact, resolve_chunk_file
 from backend.wage_files import resolve_wage_file
 from backend.entitlement_files import resolve_entitlement_file
+from backend.ingest.extract_wages import lookup_wage as lookup_wage_in_table
+from backend.ingest.extract_entitlements import (
+    lookup_vacation_entitlement as lookup_vacation_entitlement_in_table,
+)
 from backend.user.profile import get_classification_options
 from backend.language_lexicon_files import resolve_language_lexicon_file
 from backend.contracts import resolve_contract_region_id
@@ -458,8 +472,7 @@ def contract_supports_side_letter_doc_type_filter(contract_id: str = CONTRACT_ID
         return False
 
     try:
-        with open(chunks_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
+        payload = load_chunk_payload(chunks_path)
     except Exception:
         return False
 
@@ -496,8 +509,7 @@ def infer_side_letter_articles(contract_id: str = CONTRACT_ID) -> list[int]:
         return []
 
     try:
-        with open(chunks_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
+        payload = load_chunk_payload(chunks_path)
     except Exception:
         return []
 
@@ -581,38 +593,59 @@ def _is_side_letter_followup_query(query_text: str) -> bool:
     )
     return has_reference and has_followup_cue
 
-def expand_query(query: str, contract_id: str = CONTRACT_ID) -> Tuple[str, list]:
+@lru_cache(maxsize=16)
+def _get_slang_expansion_table(contract_id: str = CONTRACT_ID) -> tuple:
     """
-    Expand query by replacing worker slang with contract terminology.
-
-    Args:
-        query: The user's question
-        contract_id: Contract ID for loading contract-specific slang
+    (slang, contract_term, compiled word-boundary pattern) for a contract.
 
-    Returns:
-        Tuple of (expanded_query, list of expansions applied)
+    Sorted by slang length (longest first) to avoid partial replacements.
+    Overlapping aliases (e.g. "float" inside "float days") must each be able
+    to fire, so this stays a per-alias table rather than one alternation.
     """
     slang_map = get_slang_map(contract_id)
-    query_lower = query.lower()
-    expanded = query
-    expansions_applied = []
-
-    # Sort by length (longest first) to avoid partial replacements
     sorted_slang = sorted(slang_map.items(), key=lambda x: len(x[0]), reverse=True)
+    return tuple(
+        (slang, contract_term, re.compile(r'\b' + re.escape(slang) + r'\b'))
+        for slang, contract_term in sorted_slang
+    )
 
-    for slang, contract_term in sorted_slang:
-        # Use word boundaries to avoid partial matches
-        pattern = r'\b' + re.escape(slang) + r'\b'
-        if re.search(pattern, query_lower):
-            # Append contract terms to the query rather than replacing
-            # This preserves the original query while adding searchable terms
-            if contract_term not in expanded.lower():
-                expanded = f"{expanded} ({contract_term})"
-                expansions_applied.append(f"{slang} -> {contract_term}")
 
-    # Deterministic phrase detectors for common worker phrasing that may not
-    # appear verbatim in contract text.
-    pattern_expansions = [
+_WORD_RUN_RE = re.compile(r"\w+")
+
+# Per-process memo size for the pure query -> routing-signal helpers below.
+_QUERY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=16)
+def _get_slang_token_index(contract_id: str = CONTRACT_ID) -> tuple:
+    """
+    Index the slang table by each alias's leading word.
+
+    A word-bounded alias that starts with a word character can only match
+    where the query has a word equal to the alias's first \\w+ run, so one
+    tokenization of the query yields every candidate alias. Returns
+    (first word -> table positions, positions that must always be tried).
+    """
+    by_first_word: dict[str, list[int]] = {}
+    unindexed: list[int] = []
+    for position, (slang, _, _) in enumerate(_get_slang_expansion_table(contract_id)):
+        first_word = _WORD_RUN_RE.match(slang)
+        if first_word is None:
+            unindexed.append(position)
+            continue
+        by_first_word.setdefault(first_word.group(0), []).append(position)
+    return (
+        {word: tuple(positions) for word, positions in by_first_word.items()},
+        tuple(unindexed),
+    )
+
+
+# Deterministic phrase detectors for common worker phrasing that may not
+# appear verbatim in contract text. Each carries cue substrings, at least one
+# of which every match must contain, so most queries skip the regex entirely.
+_PATTERN_EXPANSIONS = tuple(
+    (re.compile(pattern), contract_term, label, cues)
+    for pattern, contract_term, label, cues in (
         (
             r"(?:\bcontract\b|\bagreement\b|\bcba\b).*(?:\bstart\b|\bbegin\b|\beffective\b).*(?:\bend\b|\bexpir)"
             r"|(?:\bstart\b|\bbegin\b|\beffective\b).*(?:\bend\b|\bexpir).*(?:\bcontract\b|\bagreement\b|\bcba\b)"
@@ -620,16 +653,19 @@ def expand_query(query: str, contract_id: str = CONTRACT_ID) -> Tuple[str, list]
             r"|\brun\s*through\b|\bin\s*force\s*through\b",
             "term of agreement effective date expiration date start date end date",
             "contract term pattern",
+            ("contract", "agreement", "cba", "start", "begin", "effective", "term", "expiration", "run", "force"),
         ),
         (
             r"\bstewards?\b.*\b(conference|meeting)\b|\bunion\s*meeting\b.*\bstewards?\b",
             "annual union stewards conference adjust union stewards work schedules regular local union meeting scheduled later than 6:00 p.m.",
             "steward schedule pattern",
+            ("steward",),
         ),
         (
             r"\bclose\b.*\bopen\b|\bopen\b.*\bclose\b",
             "minimum rest period between shifts relief periods lunch breaks",
             "close/open pattern",
+            ("close",),
         ),
         (
             r"\bminimum\b.*\bhours?\b.*\bbetween\b.*\bshifts?\b"
@@ -637,25 +673,73 @@ def expand_query(query: str, contract_id: str = CONTRACT_ID) -> Tuple[str, list]
             r"|\bbetween\b.*\bend\b.*\bshift\b.*\bstart\b.*\bnext\b",
             "minimum rest period between shifts relief periods lunch breaks",
             "inter-shift rest pattern",
+            ("between",),
         ),
         (
             r"\b(funeral|died|death)\b",
             "bereavement leave funeral leave paid days",
             "bereavement pattern",
+            ("funeral", "died", "death"),
         ),
         (
             r"\b(store|location)\b.*\b(shut|closing|close)\b",
             "store closing severance pay",
             "store closing pattern",
+            ("store", "location"),
         ),
-    ]
-    for pattern, contract_term, label in pattern_expansions:
-        if re.search(pattern, query_lower):
-            if contract_term not in expanded.lower():
+    )
+)
+
+
+def expand_query(query: str, contract_id: str = CONTRACT_ID) -> Tuple[str, list]:
+    """
+    Expand query by replacing worker slang with contract terminology.
+
+    Args:
+        query: The user's question
+        contract_id: Contract ID for loading contract-specific slang
+
+    Returns:
+        Tuple of (expanded_query, list of expansions applied)
+    """
+    expanded, expansions_applied = _expand_query_cached(query, contract_id)
+    return expanded, list(expansions_applied)
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _expand_query_cached(query: str, contract_id: str) -> tuple[str, tuple]:
+    query_lower = query.lower()
+    expanded = query
+    # Lowercased mirror of `expanded`, grown alongside it, for the
+    # already-present check (avoids re-lowering the whole string per term).
+    expanded_lower = query_lower
+    expansions_applied = []
+
+    slang_table = _get_slang_expansion_table(contract_id)
+    by_first_word, candidates = _get_slang_token_index(contract_id)
+    candidates = set(candidates)
+    for word in set(_WORD_RUN_RE.findall(query_lower)):
+        candidates.update(by_first_word.get(word, ()))
+
+    # Table order (longest alias first) decides the expansion order.
+    for position in sorted(candidates):
+        slang, contract_term, pattern = slang_table[position]
+        if pattern.search(query_lower):
+            # Append contract terms to the query rather than replacing
+            # This preserves the original query while adding searchable terms
+            if contract_term not in expanded_lower:
                 expanded = f"{expanded} ({contract_term})"
+                expanded_lower = f"{expanded_lower} ({contract_term.lower()})"
+                expansions_applied.append(f"{slang} -> {contract_term}")
+
+    for pattern, contract_term, label, cues in _PATTERN_EXPANSIONS:
+        if any(cue in query_lower for cue in cues) and pattern.search(query_lower):
+            if contract_term not in expanded_lower:
+                expanded = f"{expanded} ({contract_term})"
+                expanded_lower = f"{expanded_lower} ({contract_term.lower()})"
                 expansions_applied.append(f"{label} -> {contract_term}")
 
-    return expanded, expansions_applied
+    return expanded, tuple(expansions_applied)
 
 
 @lru_cache(maxsize=16)
@@ -732,6 +816,10 @@ def _contract_classification_aliases(contract_id: str = CONTRACT_ID) -> dict[str
     return alias_to_value
 
 
+_INNER_APOSTROPHE_RE = re.compile(r"(?<=\w)'(?=\w)")
+_NON_ALNUM_RUN_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _normalize_query_text(text: str) -> str:
     """
     Normalize free text for deterministic lexical matching.
@@ -743,9 +831,10 @@ def _normalize_query_text(text: str) -> str:
     """
     raw = str(text or "").lower()
     raw = raw.replace("’", "'").replace("`", "'")
-    raw = re.sub(r"(?<=\w)'(?=\w)", "", raw)
-    raw = re.sub(r"[^a-z0-9]+", " ", raw)
-    return re.sub(r"\s+", " ", raw).strip()
+    raw = _INNER_APOSTROPHE_RE.sub("", raw)
+    # Each non-alphanumeric run (whitespace included) becomes one space, so
+    # the result needs no separate whitespace-collapsing pass.
+    return _NON_ALNUM_RUN_RE.sub(" ", raw).strip()
 
 
 def _classification_alias_candidates(raw: str) -> list[str]:
@@ -806,7 +895,7 @@ def normalize_classification_for_contract(
     return re.sub(r"[^a-z0-9]+", "_", raw).strip("_") or raw
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryIntent:
     """Classified intent of a user query."""
     intent_type: str  # 'wage', 'contract', 'high_stakes'
@@ -818,18 +907,10 @@ class QueryIntent:
     high_stakes_topic: bool = False
     active_urgent_context: bool = False
     escalation_policy: str = "deterministic_v1"
-    relevant_articles: list = None  # Articles relevant to detected topic
-    mentioned_classifications: list = None
+    relevant_articles: list = field(default_factory=list)  # Articles relevant to detected topic
+    mentioned_classifications: list = field(default_factory=list)
     comparison_mode: bool = False
-    required_evidence_slots: list = None
-    
-    def __post_init__(self):
-        if self.relevant_articles is None:
-            self.relevant_articles = []
-        if self.mentioned_classifications is None:
-            self.mentioned_classifications = []
-        if self.required_evidence_slots is None:
-            self.required_evidence_slots = []
+    required_evidence_slots: list = field(default_factory=list)
 
 
 # Wage-related keywords (specific phrases to avoid false positives)
@@ -848,6 +929,8 @@ WAGE_EXCLUDE_PATTERNS = [
     "vacation", "holiday", "sick", "time off", "pto", "personal day",
     "pay stub", "pay period", "pay check"
 ]
+# Single-pass substring check over WAGE_EXCLUDE_PATTERNS.
+_WAGE_EXCLUDE_RE = re.compile("|".join(re.escape(p) for p in WAGE_EXCLUDE_PATTERNS))
 
 # Topics where "rate" language is often legal-calculation text, not wage lookup.
 WAGE_SUPPRESS_TOPICS = {
@@ -859,6 +942,23 @@ WAGE_SUPPRESS_TOPICS = {
     "term",
 }
 
+# "Section N" cross-references inside chunk text.
+_SECTION_REF_RE = re.compile(r"\bSection\s+(\d+)\b", re.IGNORECASE)
+
+# Wage-routing cues used by classify_intent.
+_WAGE_TOKEN_RE = re.compile(r"\b(pay|wage|rate|make|earn|paid|hourly)\b")
+_PERSONAL_SIGNAL_RE = re.compile(r"\b(my|me|i)\b")
+_COMP_TOKEN_RE = re.compile(r"\b(pay|wage|salary|hourly|make|earn|rate)\b")
+_ROLE_WAGE_QUESTION_RE = re.compile(
+    r"\b(what|how much)\b.*\b(do|does|is|are)\b.*\b(make|earn|paid|pay|wage|rate)\b"
+)
+_LEGAL_CLAUSE_CUE_RE = re.compile(
+    r"\b(shall|section|article|hereof|thereof|for all work performed|in addition to)\b"
+)
+_EXPLICIT_WAGE_PHRASE_RE = re.compile(
+    r"\b(what (do|am|should) i (make|earn|be making)|what'?s my pay|my pay|my wage|my salary)\b"
+)
+
 # Classification extraction patterns
 CLASSIFICATION_PATTERNS = {
     "courtesy_clerk": r"courtesy\s*clerk|bagger",
@@ -871,6 +971,10 @@ CLASSIFICATION_PATTERNS = {
     "other_assistant_managers": r"other\s*assistant\s*managers?|assistant\s*managers?",
     "non_foods_clerk": r"non.?food|gm\s*clerk|general\s*merchandise|non.?food.*gm.*floral|floral",
 }
+_CLASSIFICATION_RES = tuple(
+    (class_name, re.compile(pattern)) for class_name, pattern in CLASSIFICATION_PATTERNS.items()
+)
+_PROMOTION_CUE_RE = re.compile(r"\b(promot|promotion|transfer|move)\b")
 
 CONTRACT_TERM_CUE_PATTERN = (
     r"term\s*of|contract\s*term|agreement\s*term|term\s*of\s*(agreement|contract)|"
@@ -967,15 +1071,26 @@ STEWARD_UNION_MEETING_SCHEDULE_QUERY_PATTERN = (
 # Article numbers are always contract-specific and should not be hardcoded.
 
 
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
 def extract_classification(query: str) -> Optional[str]:
     """Extract job classification from query."""
     query_lower = _normalize_query_text(query)
-    for class_name, pattern in CLASSIFICATION_PATTERNS.items():
-        if re.search(pattern, query_lower):
+    for class_name, pattern in _CLASSIFICATION_RES:
+        if pattern.search(query_lower):
             return class_name
     return None
 
 
+@lru_cache(maxsize=16)
+def _get_classification_alias_patterns(contract_id: str = CONTRACT_ID) -> tuple:
+    """Compiled token-bounded (phrase, value, pattern) triples for a contract's aliases."""
+    return tuple(
+        (phrase, value, re.compile(rf"(?<![a-z0-9]){re.escape(phrase)}(?![a-z0-9])"))
+        for phrase, value in _contract_classification_aliases(contract_id).items()
+        if phrase and len(phrase) >= 2
+    )
+
+
 def extract_classification_for_contract(query: str, contract_id: str = CONTRACT_ID) -> Optional[str]:
     """
     Extract contract-scoped classification from query.
@@ -987,21 +1102,17 @@ def extract_classification_for_contract(query: str, contract_id: str = CONTRACT_
     4) Legacy static regex fallback
     """
     query_lower = _normalize_query_text(query)
-    aliases = _contract_classification_aliases(contract_id)
     matches: list[tuple[str, str, int]] = []  # (phrase, value, start_idx)
 
-    for phrase, value in aliases.items():
-        if not phrase or len(phrase) < 2:
-            continue
-        pattern = rf"(?<![a-z0-9]){re.escape(phrase)}(?![a-z0-9])"
-        m = re.search(pattern, query_lower)
+    for phrase, value, pattern in _get_classification_alias_patterns(contract_id):
+        m = pattern.search(query_lower)
         if not m:
             continue
         matches.append((phrase, value, m.start()))
 
     if matches:
         # Promotion/demotion style: prefer destination classification after "to".
-        if re.search(r"\b(promot|promotion|transfer|move)\b", query_lower):
+        if _PROMOTION_CUE_RE.search(query_lower):
             directional = sorted(
                 (
                     t for t in matches
@@ -1068,6 +1179,53 @@ def extract_classifications_for_contract(
     return ordered_values
 
 
+# Priority order: specific topics first, generic topics last
+TOPIC_PRIORITY = (
+    "retirement_savings",
+    "weingarten",
+    "health_benefits",
+    "probation",
+    "promotion",
+    "term",
+    "personal_holiday",  # Check before vacation since it's more specific
+    "bereavement",
+    "layoff",
+    "sick_leave",
+    "premiums",
+    "vacation",
+    "overtime",
+    "grievance",
+    "discipline",
+    "seniority",
+    "breaks",
+    "scheduling",  # Generic - matches "hours" so put last
+)
+_TOPIC_PRIORITY_SET = frozenset(TOPIC_PRIORITY)
+
+
+@lru_cache(maxsize=16)
+def _get_topic_match_order(contract_id: str = CONTRACT_ID) -> tuple:
+    """
+    Compiled (topic, pattern) pairs in extract_topic() match order.
+
+    Priority topics come first, followed by any remaining (manifest-added)
+    topics in manifest order. Role-like topics are never returned.
+    """
+    topic_patterns = get_topic_patterns(contract_id)
+    priority_pairs = [
+        (topic, re.compile(topic_patterns[topic]))
+        for topic in TOPIC_PRIORITY
+        if topic in topic_patterns and topic not in _ROLE_LIKE_TOPICS
+    ]
+    remaining_pairs = [
+        (topic, re.compile(pattern))
+        for topic, pattern in topic_patterns.items()
+        if topic not in _TOPIC_PRIORITY_SET and topic not in _ROLE_LIKE_TOPICS
+    ]
+    return tuple(priority_pairs + remaining_pairs)
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
 def extract_topic(query: str, contract_id: str = CONTRACT_ID) -> Optional[str]:
     """
     Extract main topic from query.
@@ -1075,48 +1233,10 @@ def extract_topic(query: str, contract_id: str = CONTRACT_ID) -> Optional[str]:
     Uses priority ordering to prefer more specific topics over generic ones.
     Merges universal patterns with contract-specific patterns from manifest.
     """
-    topic_patterns = get_topic_patterns(contract_id)
     query_lower = _normalize_query_text(query)
-
-    # Priority order: specific topics first, generic topics last
-    TOPIC_PRIORITY = [
-        "retirement_savings",
-        "weingarten",
-        "health_benefits",
-        "probation",
-        "promotion",
-        "term",
-        "personal_holiday",  # Check before vacation since it's more specific
-        "bereavement",
-        "layoff",
-        "sick_leave",
-        "premiums",
-        "vacation",
-        "overtime",
-        "grievance",
-        "discipline",
-        "seniority",
-        "breaks",
-        "scheduling",  # Generic - matches "hours" so put last
-    ]
-
-    # First pass: check topics in priority order
-    for topic in TOPIC_PRIORITY:
-        if topic in _ROLE_LIKE_TOPICS:
-            continue
-        if topic in topic_patterns:
-            pattern = topic_patterns[topic]
-            if re.search(pattern, query_lower):
-                return topic
-
-    # Second pass: check any remaining topics
-    for topic, pattern in topic_patterns.items():
-        if topic in _ROLE_LIKE_TOPICS:
-            continue
-        if topic not in TOPIC_PRIORITY:
-            if re.search(pattern, query_lower):
-                return topic
-
+    for topic, pattern in _get_topic_match_order(contract_id):
+        if pattern.search(query_lower):
+            return topic
     return None
 
 
@@ -1516,14 +1636,37 @@ def build_query_plan(
     )
 
 
+# Wage question shapes; the raw pattern text doubles as the audit label.
+WAGE_QUERY_PATTERNS = [
+    r"how much (do|does|will|would|should) .+ (make|earn|get paid|be making|be earning)",
+    r"what (is|are|should) (my|the) (pay|wage|rate)",
+    r"what (is|are) .+ (pay|wage|rate)",
+    r"what (do|does) .+ (make|earn|get paid)",
+    r"what .+ (pay|wage|rate) .+ for",
+    r"what (is|are|'s) the .+ rate of pay",
+    r"what should i (make|be making|earn|be earning)",
+    r"\$\d+.*hour",  # Dollar amounts with hour
+]
+_WAGE_QUERY_RES = tuple((pattern, re.compile(pattern)) for pattern in WAGE_QUERY_PATTERNS)
+_PAY_WORD_RE = re.compile(r"\b(pay|wage|hourly)\b")
+_FOR_AS_RE = re.compile(r"\b(for|as)\b")
+_CONTEXTUAL_WAGE_SIGNAL_RE = re.compile(r"\b(rate|wage|pay|paid|progression|step|increase|hourly)\b")
+_HOURS_AMOUNT_RE = re.compile(r"\b\d[\d,]*\s*hours?\b")
+
+
 def is_wage_query(query: str) -> tuple[bool, list]:
     """Check if query is asking about wages/pay."""
+    is_wage, matched = _is_wage_query_cached(query)
+    return is_wage, list(matched)
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _is_wage_query_cached(query: str) -> tuple[bool, tuple]:
     query_lower = query.lower()
 
     # First check if this is actually about time off/benefits (not wages)
-    for exclude in WAGE_EXCLUDE_PATTERNS:
-        if exclude in query_lower:
-            return False, []
+    if _WAGE_EXCLUDE_RE.search(query_lower):
+        return False, ()
 
     matched = []
     for keyword in WAGE_KEYWORDS:
@@ -1531,27 +1674,16 @@ def is_wage_query(query: str) -> tuple[bool, list]:
             matched.append(keyword)
 
     # Also check for specific patterns
-    wage_patterns = [
-        r"how much (do|does|will|would|should) .+ (make|earn|get paid|be making|be earning)",
-        r"what (is|are|should) (my|the) (pay|wage|rate)",
-        r"what (is|are) .+ (pay|wage|rate)",
-        r"what (do|does) .+ (make|earn|get paid)",
-        r"what .+ (pay|wage|rate) .+ for",
-        r"what (is|are|'s) the .+ rate of pay",
-        r"what should i (make|be making|earn|be earning)",
-        r"\$\d+.*hour",  # Dollar amounts with hour
-    ]
-
-    for pattern in wage_patterns:
-        if re.search(pattern, query_lower):
+    for pattern, compiled in _WAGE_QUERY_RES:
+        if compiled.search(query_lower):
             matched.append(f"pattern:{pattern}")
 
     # Keep this strict: legal prose often contains "rate ... for" but is not
     # asking for a personal wage lookup.
-    if re.search(r"\b(pay|wage|hourly)\b", query_lower) and re.search(r"\b(for|as)\b", query_lower):
+    if _PAY_WORD_RE.search(query_lower) and _FOR_AS_RE.search(query_lower):
         matched.append("pattern:role_targeted_pay_for")
 
-    return len(matched) > 0, matched
+    return len(matched) > 0, tuple(matched)
 
 
 def is_contextual_wage_query(
@@ -1569,14 +1701,12 @@ def is_contextual_wage_query(
         return False, []
 
     q = (query or "").lower()
-    if any(ex in q for ex in WAGE_EXCLUDE_PATTERNS):
+    if _WAGE_EXCLUDE_RE.search(q):
         return False, []
 
-    wage_signal = bool(
-        re.search(r"\b(rate|wage|pay|paid|progression|step|increase|hourly)\b", q)
-    )
+    wage_signal = bool(_CONTEXTUAL_WAGE_SIGNAL_RE.search(q))
     progression_signal = bool(
-        re.search(r"\b\d[\d,]*\s*hours?\b", q)
+        _HOURS_AMOUNT_RE.search(q)
         or "basket hours" in q
         or topic in {"promotion", "wages"}
     )
@@ -1597,6 +1727,51 @@ CONDITIONAL_SUPPRESSOR_PATTERNS = [
     r"\bwould i\b",
 ]
 
+# Stage 1 (topic) and stage 2 (active incident) high-stakes patterns. The raw
+# pattern text doubles as the audit label in classify_high_stakes_context().
+HIGH_STAKES_TOPIC_PATTERNS = [
+    r"\bdisciplin(e|ary|ed|ing)?\b",
+    r"\bterminat(e|ed|ion|ing)\b",
+    r"\bdischarg(e|ed)\b",
+    r"\bfired\b",
+    r"\bharass(ed|ment|ing)?\b",
+    r"\bdiscriminat(ed|e|ion|ing)\b",
+    r"\bretaliat(es|ed|e|ion|ing)\b",
+    r"\bweingarten\b",
+    r"\binvestigation(s)?\b",
+    r"\bsuspend(ed|s|ing)?\b|\bsuspension\b",
+    r"\bwritten up\b|\bwrite up\b",
+    r"\bunsafe\b|\bdanger(ous)?\b|\binjur(y|ed)\b",
+]
+
+HIGH_STAKES_ACTIVE_PATTERNS = [
+    r"(i'?m|i am|was|been|being|getting) (just\s+)?(fired|terminated|discharged)",
+    r"(i'?m|i am|was|been|being|getting) (disciplined|written up|suspended)",
+    r"(i|i am|i was|i got|i have been|i've been).*(written up|suspended)",
+    r"(my\s+)?(manager|boss|supervisor).*(wrote me up|disciplined me|suspended me)",
+    r"(i'?m|i am) being (harass|discriminat)",
+    r"(i'?m|i am|i was) (harassed|discriminated against|retaliated against)",
+    r"(harassing|discriminating\s+against|retaliating\s+against)\s+me",
+    r"(my\s+)?(manager|boss|supervisor|coworker).*(harass|discriminat|retaliat)",
+    r"(i'?m|i am|i was).*(called|summoned).*(disciplinary\s+)?(meeting|office)",
+    r"(called|summoned) (into|to) (a\s+)?(meeting|office)",
+    r"just (got|been|was) (terminated|fired|discharged|written up|suspended)",
+    r"(manager|boss|supervisor).*(wants|asked|told|called).*(meeting|office|talk)",
+    r"(i'?m|i am|i got|i was) injured",
+    r"(right now|today|yesterday|just happened).*(fired|terminated|discharged|written up|suspended|harass|discriminat|retaliat|injur|unsafe)",
+    r"(fired|terminated|discharged|written up|suspended|harass|discriminat|retaliat|injur|unsafe).*(right now|today|yesterday|just happened)",
+]
+
+_HIGH_STAKES_TOPIC_RES = tuple((p, re.compile(p)) for p in HIGH_STAKES_TOPIC_PATTERNS)
+_HIGH_STAKES_ACTIVE_RES = tuple((p, re.compile(p)) for p in HIGH_STAKES_ACTIVE_PATTERNS)
+_CONDITIONAL_SUPPRESSOR_RES = tuple((p, re.compile(p)) for p in CONDITIONAL_SUPPRESSOR_PATTERNS)
+# Token-aware keyword matching avoids false positives like "hired" -> "fired".
+_HIGH_STAKES_KEYWORD_RES = tuple(
+    (topic_norm, re.compile(rf"(?<![a-z0-9]){re.escape(topic_norm)}(?![a-z0-9])"))
+    for topic_norm in (str(topic or "").strip().lower() for topic in HIGH_STAKES_TOPICS)
+    if topic_norm
+)
+
 
 def classify_high_stakes_context(query: str) -> tuple[bool, bool, list]:
     """
@@ -1608,62 +1783,32 @@ def classify_high_stakes_context(query: str) -> tuple[bool, bool, list]:
         - active_urgent_context: current live incident detected (escalation trigger)
         - matched_patterns: audit trail of matched rules
     """
+    high_stakes_topic, active_urgent_context, matched = _classify_high_stakes_context_cached(query)
+    return high_stakes_topic, active_urgent_context, list(matched)
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _classify_high_stakes_context_cached(query: str) -> tuple[bool, bool, tuple]:
     query_lower = query.lower()
     matched = []
     high_stakes_topic = False
     active_urgent_context = False
 
     # Stage 1: high-stakes topic detection (informational or active)
-    topic_patterns = [
-        r"\bdisciplin(e|ary|ed|ing)?\b",
-        r"\bterminat(e|ed|ion|ing)\b",
-        r"\bdischarg(e|ed)\b",
-        r"\bfired\b",
-        r"\bharass(ed|ment|ing)?\b",
-        r"\bdiscriminat(ed|e|ion|ing)\b",
-        r"\bretaliat(es|ed|e|ion|ing)\b",
-        r"\bweingarten\b",
-        r"\binvestigation(s)?\b",
-        r"\bsuspend(ed|s|ing)?\b|\bsuspension\b",
-        r"\bwritten up\b|\bwrite up\b",
-        r"\bunsafe\b|\bdanger(ous)?\b|\binjur(y|ed)\b",
-    ]
-
-    for pattern in topic_patterns:
-        if re.search(pattern, query_lower):
+    for pattern, compiled in _HIGH_STAKES_TOPIC_RES:
+        if compiled.search(query_lower):
             matched.append(f"topic:{pattern}")
             high_stakes_topic = True
 
-    for topic in HIGH_STAKES_TOPICS:
-        topic_norm = str(topic or "").strip().lower()
-        if not topic_norm:
-            continue
-        # Use token-aware matching to avoid false positives like "hired" -> "fired".
-        patt = rf"(?<![a-z0-9]){re.escape(topic_norm)}(?![a-z0-9])"
-        if re.search(patt, query_lower):
+    for topic_norm, compiled in _HIGH_STAKES_KEYWORD_RES:
+        # Plain substring test first; the regex only adds token boundaries.
+        if topic_norm in query_lower and compiled.search(query_lower):
             matched.append(f"topic_keyword:{topic_norm}")
             high_stakes_topic = True
 
     # Stage 2: active/urgent context detection (actual escalation trigger)
-    active_patterns = [
-        r"(i'?m|i am|was|been|being|getting) (just\s+)?(fired|terminated|discharged)",
-        r"(i'?m|i am|was|been|being|getting) (disciplined|written up|suspended)",
-        r"(i|i am|i was|i got|i have been|i've been).*(written up|suspended)",
-        r"(my\s+)?(manager|boss|supervisor).*(wrote me up|disciplined me|suspended me)",
-        r"(i'?m|i am) being (harass|discriminat)",
-        r"(i'?m|i am|i was) (harassed|discriminated against|retaliated against)",
-        r"(harassing|discriminating\s+against|retaliating\s+against)\s+me",
-        r"(my\s+)?(manager|boss|supervisor|coworker).*(harass|discriminat|retaliat)",
-        r"(i'?m|i am|i was).*(called|summoned).*(disciplinary\s+)?(meeting|office)",
-        r"(called|summoned) (into|to) (a\s+)?(meeting|office)",
-        r"just (got|been|was) (terminated|fired|discharged|written up|suspended)",
-        r"(manager|boss|supervisor).*(wants|asked|told|called).*(meeting|office|talk)",
-        r"(i'?m|i am|i got|i was) injured",
-        r"(right now|today|yesterday|just happened).*(fired|terminated|discharged|written up|suspended|harass|discriminat|retaliat|injur|unsafe)",
-        r"(fired|terminated|discharged|written up|suspended|harass|discriminat|retaliat|injur|unsafe).*(right now|today|yesterday|just happened)",
-    ]
-    for pattern in active_patterns:
-        if re.search(pattern, query_lower):
+    for pattern, compiled in _HIGH_STAKES_ACTIVE_RES:
+        if compiled.search(query_lower):
             matched.append(f"active:{pattern}")
             active_urgent_context = True
 
@@ -1673,8 +1818,8 @@ def classify_high_stakes_context(query: str) -> tuple[bool, bool, list]:
 
     # Suppress escalation for conditional/hypothetical language
     suppressor_hit = False
-    for pattern in CONDITIONAL_SUPPRESSOR_PATTERNS:
-        if re.search(pattern, query_lower):
+    for pattern, compiled in _CONDITIONAL_SUPPRESSOR_RES:
+        if compiled.search(query_lower):
             matched.append(f"suppressor:{pattern}")
             suppressor_hit = True
 
@@ -1683,7 +1828,7 @@ def classify_high_stakes_context(query: str) -> tuple[bool, bool, list]:
         active_urgent_context = False
         matched.append("suppressor:active_context_reset")
 
-    return high_stakes_topic, active_urgent_context, matched
+    return high_stakes_topic, active_urgent_context, tuple(matched)
 
 
 def is_high_stakes(query: str) -> tuple[bool, list, bool]:
@@ -1696,6 +1841,10 @@ def classify_intent(query: str, user_classification: str = None, contract_id: st
     """
     Classify the intent of a user query.
 
+    Classification is pure regex/keyword matching over the query and the
+    contract manifests, so results are memoized per (query, classification,
+    contract). Callers get their own copy since they patch topic/articles.
+
     Args:
         query: The user's question
         user_classification: Optional classification from user profile (e.g., from dropdown)
@@ -1705,6 +1854,11 @@ def classify_intent(query: str, user_classification: str = None, contract_id: st
         QueryIntent with type, confidence, and metadata
     """
     ensure_contract_manifest(contract_id)
+    return copy.deepcopy(_classify_intent_cached(query, user_classification, contract_id))
+
+
+@lru_cache(maxsize=2048)
+def _classify_intent_cached(query: str, user_classification: Optional[str], contract_id: str) -> QueryIntent:
     plan = build_query_plan(
         query=query,
         contract_id=contract_id,
@@ -1716,6 +1870,7 @@ def classify_intent(query: str, user_classification: str = None, contract_id: st
     classes_for_routing = list(plan.mentioned_classifications)
     
     is_wage, wage_matches = is_wage_query(query)
+    query_norm = None  # _normalize_query_text(query), computed on first use
     if not is_wage:
         contextual_wage, contextual_matches = is_contextual_wage_query(
             query=query,
@@ -1727,17 +1882,12 @@ def classify_intent(query: str, user_classification: str = None, contract_id: st
             wage_matches = wage_matches + contextual_matches
     if not is_wage and classes_for_routing:
         query_norm = _normalize_query_text(query)
-        has_wage_token = bool(re.search(r"\b(pay|wage|rate|make|earn|paid|hourly)\b", query_norm))
-        has_personal_signal = bool(re.search(r"\b(my|me|i)\b", query_norm))
+        has_wage_token = bool(_WAGE_TOKEN_RE.search(query_norm))
+        has_personal_signal = bool(_PERSONAL_SIGNAL_RE.search(query_norm))
         has_role_wage_question = bool(
-            re.search(r"\b(what|how much)\b.*\b(do|does|is|are)\b.*\b(make|earn|paid|pay|wage|rate)\b", query_norm)
-        )
-        legal_clause_cue = bool(
-            re.search(
-                r"\b(shall|section|article|hereof|thereof|for all work performed|in addition to)\b",
-                query_norm,
-            )
+            _ROLE_WAGE_QUESTION_RE.search(query_norm)
         )
+        legal_clause_cue = bool(_LEGAL_CLAUSE_CUE_RE.search(query_norm))
         if has_wage_token and (has_personal_signal or has_role_wage_question) and not legal_clause_cue:
             is_wage = True
             wage_matches = wage_matches + ["contextual_role_targeted_wage"]
@@ -1745,37 +1895,29 @@ def classify_intent(query: str, user_classification: str = None, contract_id: st
     # Suppress wage routing for legal premium/overtime calculations unless the
     # user is explicitly asking about their own compensation.
     if is_wage and topic in WAGE_SUPPRESS_TOPICS:
-        q_norm = _normalize_query_text(query)
+        if query_norm is None:
+            query_norm = _normalize_query_text(query)
         has_personal_comp_signal = bool(
-            re.search(r"\b(my|me|i)\b", q_norm)
-            and re.search(r"\b(pay|wage|salary|hourly|make|earn|rate)\b", q_norm)
-        )
-        has_explicit_wage_phrase = bool(
-            re.search(
-                r"\b(what (do|am|should) i (make|earn|be making)|what'?s my pay|my pay|my wage|my salary)\b",
-                q_norm,
-            )
+            _PERSONAL_SIGNAL_RE.search(query_norm)
+            and _COMP_TOKEN_RE.search(query_norm)
         )
+        has_explicit_wage_phrase = bool(_EXPLICIT_WAGE_PHRASE_RE.search(query_norm))
         if not has_personal_comp_signal and not has_explicit_wage_phrase:
             is_wage = False
             wage_matches = []
 
     # Global suppression for legal-clause quoting with wage-like words.
     if is_wage:
-        q_norm = _normalize_query_text(query)
+        if query_norm is None:
+            query_norm = _normalize_query_text(query)
         has_personal_comp_signal = bool(
-            re.search(r"\b(my|me|i)\b", q_norm)
-            and re.search(r"\b(pay|wage|salary|hourly|make|earn|rate)\b", q_norm)
+            _PERSONAL_SIGNAL_RE.search(query_norm)
+            and _COMP_TOKEN_RE.search(query_norm)
         )
         has_role_wage_question = bool(
-            re.search(r"\b(what|how much)\b.*\b(do|does|is|are)\b.*\b(make|earn|paid|pay|wage|rate)\b", q_norm)
-        )
-        legal_clause_cue = bool(
-            re.search(
-                r"\b(shall|section|article|hereof|thereof|for all work performed|in addition to)\b",
-                q_norm,
-            )
+            _ROLE_WAGE_QUESTION_RE.search(query_norm)
         )
+        legal_clause_cue = bool(_LEGAL_CLAUSE_CUE_RE.search(query_norm))
         if legal_clause_cue and not has_personal_comp_signal and not has_role_wage_question:
             is_wage = False
             wage_matches = []
@@ -1789,7 +1931,7 @@ def classify_intent(query: str, user_classification: str = None, contract_id: st
     # Determine primary intent
     if high_stakes_topic:
         # Add discipline/grievance articles for high-stakes
-        relevant_articles = list(set(relevant_articles + [43, 45, 46]))
+        relevant_articles = list({*relevant_articles, 43, 45, 46})
         return QueryIntent(
             intent_type="high_stakes",
             confidence=0.9 if len(hs_matches) > 1 else 0.7,
@@ -1810,7 +1952,7 @@ def classify_intent(query: str, user_classification: str = None, contract_id: st
     if is_wage:
         # Check if we have enough info for a wage lookup
         confidence = 0.8 if classification else 0.6
-        relevant_articles = list(set(relevant_articles + [8, 9]))  # Wages articles
+        relevant_articles = list({*relevant_articles, 8, 9})  # Wages articles
         return QueryIntent(
             intent_type="wage",
             confidence=confidence,
@@ -1845,6 +1987,38 @@ def classify_intent(query: str, user_classification: str = None, contract_id: st
     )
 
 
+def clear_query_routing_caches() -> None:
+    """
+    Drop every memoized routing table and query result (for tests and
+    manifest reloads).
+
+    The per-query memos are derived from the per-contract tables, so both
+    are cleared; the next call re-reads manifests and lexicons from disk.
+    """
+    for cached in (
+        # Per-contract tables
+        load_manifest_routing,
+        _load_frozen_language_aliases,
+        infer_topic_article_map,
+        infer_role_comparison_articles,
+        contract_supports_side_letter_doc_type_filter,
+        infer_side_letter_articles,
+        _get_slang_expansion_table,
+        _get_slang_token_index,
+        _contract_classification_aliases,
+        _get_classification_alias_patterns,
+        _get_topic_match_order,
+        # Per-query memos
+        _expand_query_cached,
+        extract_classification,
+        extract_topic,
+        _is_wage_query_cached,
+        _classify_high_stakes_context_cached,
+        _classify_intent_cached,
+    ):
+        cached.cache_clear()
+
+
 class HybridRetriever:
     """
     Combines hybrid search (vector + BM25) with structured wage lookups.
@@ -1852,6 +2026,24 @@ class HybridRetriever:
     Uses Reciprocal Rank Fusion to combine semantic and keyword search
     for better retrieval across union contract terminology.
     """
+
+    # Contract-scoped chunks shared by every retriever in the process:
+    # contract_id -> (source payload, scoped chunks, article index,
+    # int-normalized article index, lazily filled article -> section-ordered
+    # chunks, lazily filled article -> section-keyed rows).
+    _SHARED_CHUNKS_BY_CONTRACT: dict = {}
+    _SHARED_CHUNKS_LOCK = threading.Lock()
+    # Contracts whose background warm-up has been started in this process
+    # (guarded by _SHARED_CHUNKS_LOCK); the warmed caches are process-wide.
+    _WARM_UP_STARTED: set = set()
+
+    # Hybrid searchers (BM25 indexes) shared by retrievers over the same
+    # vector store: id(vector_store) -> (vector_store, searcher). Holding the
+    # store keeps its id from being reused. Retrievers built without a store
+    # share one default ContractVectorStore.
+    _SHARED_SEARCHERS_BY_STORE: dict = {}
+    _SHARED_DEFAULT_VECTOR_STORE = None
+    _SHARED_SEARCHERS_LOCK = threading.Lock()
     
     def __init__(self, vector_store: ContractVectorStore = None):
         """Initialize the hybrid retriever."""
@@ -1862,8 +2054,15 @@ class HybridRetriever:
         self.entitlements_data = None
         self._entitlements_by_contract = {}
         self._all_chunks_by_contract = {}
+        self._article_index_by_contract = {}
+        self._article_int_index_by_contract = {}
+        self._article_section_order_by_contract = {}
+        self._article_section_keys_by_contract = {}
+        self.semantic_cache = SemanticQueryCache() if RETRIEVAL_SEMANTIC_CACHE_ENABLED else None
+        self.result_cache = RetrievalResultCache() if RETRIEVAL_RESULT_CACHE_ENABLED else None
         self._load_wages(CONTRACT_ID)
         self._load_entitlements(CONTRACT_ID)
+        self._start_warm_up(CONTRACT_ID)
     
     def _load_wages(self, contract_id: str = CONTRACT_ID):
         """Load wage data for a contract from JSON."""
@@ -1873,8 +2072,8 @@ class HybridRetriever:
 
         wages_file = resolve_wage_file(contract_id=contract_id, allow_shared_fallback=True)
         if wages_file and wages_file.exists():
-            with open(wages_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Parsed once per process and shared by every retriever instance.
+            data = load_json_artifact(wages_file)
             self._wages_by_contract[contract_id] = data
             self.wages_data = data
             return
@@ -1899,8 +2098,7 @@ class HybridRetriever:
 
         entitlement_file = resolve_entitlement_file(contract_id=contract_id, allow_shared_fallback=True)
         if entitlement_file and entitlement_file.exists():
-            with open(entitlement_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_artifact(entitlement_file)
             self._entitlements_by_contract[contract_id] = data
             self.entitlements_data = data
             return
@@ -1909,13 +2107,21 @@ class HybridRetriever:
         self.entitlements_data = None
     
     def _ensure_hybrid_searcher(self):
-        """Lazy-initialize the hybrid searcher."""
-        if self.hybrid_searcher is None:
+        """Lazy-attach the process-wide hybrid searcher for this vector store."""
+        if self.hybrid_searcher is not None:
+            return
+        with HybridRetriever._SHARED_SEARCHERS_LOCK:
             # Create vector store only when vector search is enabled.
             if self.vector_store is None and HYBRID_VECTOR_WEIGHT > 0:
-                self.vector_store = ContractVectorStore()
-            from backend.retrieval.hybrid_search import HybridSearcher
-            self.hybrid_searcher = HybridSearcher(vector_store=self.vector_store)
+                if HybridRetriever._SHARED_DEFAULT_VECTOR_STORE is None:
+                    HybridRetriever._SHARED_DEFAULT_VECTOR_STORE = ContractVectorStore()
+                self.vector_store = HybridRetriever._SHARED_DEFAULT_VECTOR_STORE
+            store_key = id(self.vector_store)
+            shared = HybridRetriever._SHARED_SEARCHERS_BY_STORE.get(store_key)
+            if shared is None or shared[0] is not self.vector_store:
+                shared = (self.vector_store, HybridSearcher(vector_store=self.vector_store))
+                HybridRetriever._SHARED_SEARCHERS_BY_STORE[store_key] = shared
+            self.hybrid_searcher = shared[1]
     
     def lookup_wage(
         self, 
@@ -1929,10 +2135,8 @@ class HybridRetriever:
         self._load_wages(contract_id=contract_id)
         if not self.wages_data:
             return None
-        
-        # Import here to avoid circular dependency
-        from backend.ingest.extract_wages import lookup_wage
-        return lookup_wage(self.wages_data, classification, hours_worked, months_employed, effective_date)
+
+        return lookup_wage_in_table(self.wages_data, classification, hours_worked, months_employed, effective_date)
 
     def lookup_vacation_entitlement(
         self,
@@ -1945,8 +2149,7 @@ class HybridRetriever:
         self._load_entitlements(contract_id=contract_id)
         if not self.entitlements_data:
             return None
-        from backend.ingest.extract_entitlements import lookup_vacation_entitlement
-        result = lookup_vacation_entitlement(
+        result = lookup_vacation_entitlement_in_table(
             self.entitlements_data,
             months_employed=months_employed,
             hours_worked=hours_worked,
@@ -1970,9 +2173,35 @@ class HybridRetriever:
         chunks_file = resolve_chunk_file(contract_id=contract_id, allow_shared_fallback=True)
         all_chunks = []
         if chunks_file and chunks_file.exists():
-            with open(chunks_file, 'r', encoding='utf-8') as f:
-                all_chunks = json.load(f)
+            all_chunks = load_chunk_payload(chunks_file)
+
+        # Reuse the scoped list built by any retriever from the same parsed
+        # payload; load_chunk_payload returns a new object when the file changes.
+        with HybridRetriever._SHARED_CHUNKS_LOCK:
+            shared = HybridRetriever._SHARED_CHUNKS_BY_CONTRACT.get(contract_id)
+            if shared is None or shared[0] is not all_chunks:
+                shared = (all_chunks, *self._scope_contract_chunks(all_chunks, contract_id), {}, {})
+                HybridRetriever._SHARED_CHUNKS_BY_CONTRACT[contract_id] = shared
+
+        _, filtered_chunks, article_index, article_int_index, section_order, section_keys = shared
+        self._article_section_order_by_contract[contract_id] = section_order
+        self._article_section_keys_by_contract[contract_id] = section_keys
+        self._article_index_by_contract[contract_id] = article_index
+        self._article_int_index_by_contract[contract_id] = article_int_index
+        # Published last: another thread (warm-up, multi-angle retrieval) that
+        # sees the chunks via the early return above must find every index.
+        self._all_chunks_by_contract[contract_id] = filtered_chunks
+        return filtered_chunks
+
+    def _scope_contract_chunks(self, all_chunks: list, contract_id: str) -> tuple[list, dict, dict]:
+        """
+        Filter raw chunk rows to one contract and index them by article.
 
+        Scoped chunks are private copies and always have a chunk_id. Returns
+        them plus two article -> chunks indexes in file
+        order: one keyed by the raw article_num, one keyed by its int value
+        (rows whose article_num doesn't coerce are left out of the latter).
+        """
         allow_unscoped = self._allow_legacy_unscoped_chunks()
         required_region = resolve_contract_region_id(contract_id)
         filtered_chunks = []
@@ -1988,8 +2217,136 @@ class HybridRetriever:
                 c_copy["contract_id"] = contract_id
                 c_copy["region_id"] = required_region
                 filtered_chunks.append(c_copy)
-        self._all_chunks_by_contract[contract_id] = filtered_chunks
-        return filtered_chunks
+        article_index: dict = {}
+        article_int_index: dict = {}
+        for c in filtered_chunks:
+            # Every scoped chunk carries a chunk_id (citation for legacy rows)
+            # so corpus scans can read c["chunk_id"] directly.
+            if "chunk_id" not in c:
+                c["chunk_id"] = c.get("citation", "")
+            article_num = c.get("article_num")
+            if article_num is None:
+                continue
+            article_index.setdefault(article_num, []).append(c)
+            try:
+                article_int = int(article_num)
+            except (TypeError, ValueError):
+                continue
+            article_int_index.setdefault(article_int, []).append(c)
+        return filtered_chunks, article_index, article_int_index
+
+    def preload(self, contract_id: str = CONTRACT_ID, warm_query: bool = True) -> None:
+        """
+        Do the one-time loading the first retrieve() would otherwise pay for.
+
+        Blocks until the contract's chunks, wage and entitlement tables,
+        routing patterns and BM25 index are built. With warm_query (and vector
+        search enabled) it also runs one throwaway vector search so the
+        embedding model and store connection are ready before real traffic.
+        """
+        self._warm_chunk_cache(contract_id)
+        self._load_wages(contract_id)
+        self._load_entitlements(contract_id)
+        # Compiles the contract's routing, slang and topic patterns.
+        classify_intent("warm up", contract_id=contract_id)
+        expand_query("warm up", contract_id=contract_id)
+
+        self._ensure_hybrid_searcher()
+        region_id = str(resolve_contract_region_id(contract_id))
+        self.hybrid_searcher.warm_up(contract_id, region_id)
+        if warm_query and HYBRID_VECTOR_WEIGHT > 0 and self.vector_store is not None:
+            try:
+                self.vector_store.search(
+                    query="warm up",
+                    n_results=1,
+                    contract_id=contract_id,
+                    region_id=region_id,
+                )
+            except Exception as exc:
+                print(f"Warning: vector search warm-up failed for {contract_id}: {exc}")
+        if CAG_ENABLE_RERANKER:
+            get_reranker().warm_up()
+
+    def _start_warm_up(self, contract_id: str) -> None:
+        """Start the background warm-up once per process per contract."""
+        with HybridRetriever._SHARED_CHUNKS_LOCK:
+            if contract_id in HybridRetriever._WARM_UP_STARTED:
+                return
+            HybridRetriever._WARM_UP_STARTED.add(contract_id)
+        threading.Thread(
+            target=self._warm_up,
+            args=(contract_id,),
+            name="karl-retriever-warmup",
+            daemon=True,
+        ).start()
+
+    def _warm_up(self, contract_id: str) -> None:
+        """Background warm-up so the first request doesn't pay load costs."""
+        self._warm_chunk_cache(contract_id)
+        if CAG_ENABLE_RERANKER:
+            get_reranker().warm_up()
+
+    def _warm_chunk_cache(self, contract_id: str) -> None:
+        """Parse and scope a contract's chunks ahead of the first retrieve()."""
+        try:
+            self._load_all_chunks_for_contract(contract_id)
+        except Exception as exc:
+            print(f"Warning: chunk cache warm-up failed for {contract_id}: {exc}")
+
+    def _article_chunks_for_contract(self, contract_id: str, article_num) -> list:
+        """Return contract-scoped chunks for one article, in file order."""
+        self._load_all_chunks_for_contract(contract_id)
+        return self._article_index_by_contract.get(contract_id, {}).get(article_num, [])
+
+    def _article_chunks_in_section_order(self, contract_id: str, article_num) -> tuple:
+        """Return one article's chunks sorted by section, sorting each article once per process."""
+        self._load_all_chunks_for_contract(contract_id)
+        ordered = self._article_section_order_by_contract[contract_id]
+        article_chunks = ordered.get(article_num)
+        if article_chunks is None:
+            article_chunks = tuple(sorted(
+                self._article_chunks_for_contract(contract_id, article_num),
+                key=lambda x: (
+                    x.get('section_num') or 0,
+                    x.get('subsection') or ''
+                ),
+            ))
+            ordered[article_num] = article_chunks
+        return article_chunks
+
+    def _article_chunks_with_section_keys(self, contract_id: str, article_num) -> tuple:
+        """
+        Return one article's chunks as (section int, subsection str, chunk)
+        rows in file order, parsing each chunk's section fields once per process.
+        """
+        return self._section_keyed_rows(
+            contract_id,
+            self._article_chunks_for_contract(contract_id, article_num),
+        )
+
+    def _section_keyed_rows(self, contract_id: str, bucket: list) -> tuple:
+        """
+        (section int, subsection str, chunk) rows for one article-index bucket.
+
+        Memoized by bucket identity: buckets of both article indexes live, and
+        are never mutated, for as long as their shared cache entry.
+        """
+        if not bucket:
+            return ()
+        keyed = self._article_section_keys_by_contract[contract_id]
+        rows = keyed.get(id(bucket))
+        if rows is None:
+            rows = []
+            for c in bucket:
+                raw = c.get("section_num")
+                try:
+                    sec = int(raw) if raw is not None else None
+                except (TypeError, ValueError):
+                    sec = None
+                rows.append((sec, str(c.get("subsection") or ""), c))
+            rows = tuple(rows)
+            keyed[id(bucket)] = rows
+        return rows
 
     def _expand_with_related_sections(
         self,
@@ -1997,6 +2354,7 @@ class HybridRetriever:
         contract_id: str = CONTRACT_ID,
         max_total: int = 8,
         preferred_articles: Optional[list[int]] = None,
+        seen_ids: Optional[set] = None,
     ) -> list:
         """
         Expand retrieved chunks with related sections from the same articles.
@@ -2004,18 +2362,28 @@ class HybridRetriever:
         This enables cross-section synthesis by ensuring that if we retrieve
         Section 49, we also include nearby sections like 44, 45, 46 that may
         contain definitions or related provisions.
+
+        seen_ids, when given, must hold the ids of `chunks`; ids of added
+        chunks are recorded in it so later stages can reuse the set.
         """
         if not chunks:
             return chunks
+        if len(chunks) >= max_total:
+            # No room left (typically after full-article expansion), so skip
+            # the anchor scan and section-reference regexes entirely.
+            return list(chunks)
         
-        contract_chunks = self._load_all_chunks_for_contract(contract_id)
+        self._load_all_chunks_for_contract(contract_id)
+        article_index = self._article_index_by_contract.get(contract_id, {})
+        article_int_index = self._article_int_index_by_contract.get(contract_id, {})
         
         # Collect per-article retrieval anchors and cross-referenced sections.
         retrieved_articles = set()
         article_first_rank: dict[int, int] = {}
-        retrieved_ids = set()
+        build_ids = seen_ids is None
+        retrieved_ids = set() if build_ids else seen_ids
         retrieved_sections_by_article: dict[int, set[int]] = {}
-        referenced_sections_by_article: dict[int, set[int]] = {}
+        retrieved_chunks_by_article: dict[int, list[dict]] = {}
         for idx, chunk in enumerate(chunks):
             article_num = chunk.get('article_num')
             if article_num:
@@ -2034,19 +2402,9 @@ class HybridRetriever:
                         sec_int = None
                     if sec_int is not None:
                         retrieved_sections_by_article.setdefault(article_int, set()).add(sec_int)
-
-                    content_text = str(
-                        chunk.get("content_with_tables")
-                        or chunk.get("content")
-                        or ""
-                    )
-                    refs = {
-                        int(m.group(1))
-                        for m in re.finditer(r'\bSection\s+(\d+)\b', content_text, flags=re.IGNORECASE)
-                    }
-                    if refs:
-                        referenced_sections_by_article.setdefault(article_int, set()).update(refs)
-            retrieved_ids.add(chunk.get('chunk_id', chunk.get('citation', '')))
+                    retrieved_chunks_by_article.setdefault(article_int, []).append(chunk)
+            if build_ids:
+                retrieved_ids.add(chunk['chunk_id'] if 'chunk_id' in chunk else chunk.get('citation', ''))
         
         preferred_set = set(_normalize_article_list(preferred_articles or []))
 
@@ -2067,41 +2425,40 @@ class HybridRetriever:
             ),
         )
         for article_num in ordered_articles:
+            if len(chunks) + len(related_chunks) >= max_total:
+                break
             try:
                 article_int = int(article_num)
             except (TypeError, ValueError):
                 article_int = None
             # Get all sections from this article
-            article_chunks = []
-            for c in contract_chunks:
-                c_article = c.get("article_num")
-                if article_int is not None:
-                    try:
-                        c_article_int = int(c_article) if c_article is not None else None
-                    except (TypeError, ValueError):
-                        c_article_int = None
-                    same_article = c_article_int == article_int
-                else:
-                    same_article = c_article == article_num
-                if not same_article:
-                    continue
-                if c.get('chunk_id', c.get('citation', '')) in retrieved_ids:
-                    continue
-                article_chunks.append(c)
+            if article_int is not None:
+                same_article_chunks = article_int_index.get(article_int, ())
+            else:
+                same_article_chunks = article_index.get(article_num, ())
+            article_rows = [
+                row for row in self._section_keyed_rows(contract_id, same_article_chunks)
+                if row[2]["chunk_id"] not in retrieved_ids
+            ]
             
             # Add up to 2 related sections per article, prioritizing:
             # 1) Sections explicitly referenced by retrieved chunks
             # 2) Adjacent sections to retrieved section numbers
             # 3) Lowest section numbers as fallback
-            ref_secs = referenced_sections_by_article.get(article_int, set()) if article_int is not None else set()
+            # Section cross-references are only scanned for articles that are
+            # actually visited before the budget runs out.
+            ref_secs: set[int] = set()
+            for retrieved in retrieved_chunks_by_article.get(article_int, ()):
+                content_text = str(
+                    retrieved.get("content_with_tables")
+                    or retrieved.get("content")
+                    or ""
+                )
+                ref_secs.update(int(m.group(1)) for m in _SECTION_REF_RE.finditer(content_text))
             base_secs = retrieved_sections_by_article.get(article_int, set()) if article_int is not None else set()
 
-            def _related_priority(c: dict) -> tuple:
-                raw = c.get("section_num")
-                try:
-                    sec = int(raw) if raw is not None else None
-                except (TypeError, ValueError):
-                    sec = None
+            def _related_priority(row: tuple) -> tuple:
+                sec = row[0]
                 if sec is None:
                     return (3, 9999, 9999)
 
@@ -2114,20 +2471,15 @@ class HybridRetriever:
                     return (2, distance, sec)
                 return (2, 999, sec)
 
-            article_chunks.sort(key=_related_priority)
+            article_rows.sort(key=_related_priority)
             chosen_sections: set[int] = set()
             selected_for_article = 0
-            for c in article_chunks:
+            for sec, _, c in article_rows:
                 if len(chunks) + len(related_chunks) >= max_total:
                     break
                 if selected_for_article >= 2:
                     break
 
-                raw_sec = c.get("section_num")
-                try:
-                    sec = int(raw_sec) if raw_sec is not None else None
-                except (TypeError, ValueError):
-                    sec = None
                 if sec is not None and sec in chosen_sections:
                     continue
 
@@ -2140,6 +2492,9 @@ class HybridRetriever:
                 if sec is not None:
                     chosen_sections.add(sec)
         
+        if seen_ids is not None:
+            seen_ids.update(c["chunk_id"] for c in related_chunks)
+
         # Combine: original chunks first, then related
         return chunks + related_chunks
 
@@ -2418,7 +2773,7 @@ class HybridRetriever:
             if article_int > 0:
                 seed_articles.add(article_int)
 
-        existing_ids = {c.get("chunk_id", c.get("citation", "")) for c in chunks}
+        existing_ids = {c["chunk_id"] if "chunk_id" in c else c.get("citation", "") for c in chunks}
         enriched_chunks: list[dict] = list(chunks)
 
         # If we have explicit side-letter targeting or a harvested title phrase,
@@ -2428,7 +2783,7 @@ class HybridRetriever:
             contract_chunks = self._load_all_chunks_for_contract(contract_id)
             additions: list[tuple[float, dict]] = []
             for c in contract_chunks:
-                cid = c.get("chunk_id", c.get("citation", ""))
+                cid = c["chunk_id"]
                 if cid in existing_ids:
                     continue
                 doc_type = _resolved_side_letter_doc_type(c)
@@ -2479,7 +2834,7 @@ class HybridRetriever:
                     c_copy["similarity"] = max(float(c_copy.get("similarity", 0) or 0.0), 0.74)
                     c_copy["is_side_letter_seed"] = True
                     enriched_chunks.append(c_copy)
-                    existing_ids.add(c_copy.get("chunk_id", c_copy.get("citation", "")))
+                    existing_ids.add(c_copy["chunk_id"])
 
         scored_rows: list[tuple[float, float, float, int, dict]] = []
         for idx, c in enumerate(enriched_chunks):
@@ -2637,12 +2992,17 @@ class HybridRetriever:
             )
             executed_stages.append("topic_seed_coverage")
 
+        # Ids of working_chunks, shared by the two article expansions so the
+        # second one doesn't rebuild it; each adds the ids of what it appends.
+        seen_ids = {c["chunk_id"] if "chunk_id" in c else c.get("citation", "") for c in working_chunks}
+
         if plan_data.get("apply_full_article_expansion"):
             working_chunks = self._expand_to_full_article(
                 working_chunks,
                 contract_id=contract_id,
                 n_results=n_results,
                 preferred_articles=article_anchors,
+                seen_ids=seen_ids,
             )
             executed_stages.append("full_article_expansion")
 
@@ -2653,6 +3013,7 @@ class HybridRetriever:
                 contract_id=contract_id,
                 max_total=max_total,
                 preferred_articles=article_anchors,
+                seen_ids=seen_ids,
             )
             executed_stages.append("related_section_expansion")
 
@@ -2715,7 +3076,7 @@ class HybridRetriever:
         if not contract_chunks:
             return chunks
 
-        existing_ids = {c.get("chunk_id", c.get("citation", "")) for c in chunks}
+        existing_ids = {c["chunk_id"] if "chunk_id" in c else c.get("citation", "") for c in chunks}
         existing_articles = {
             int(c.get("article_num")) for c in chunks if isinstance(c.get("article_num"), int)
         }
@@ -2749,7 +3110,7 @@ class HybridRetriever:
             candidates = [
                 c for c in contract_chunks
                 if c.get("article_num") == article_num
-                and c.get("chunk_id", c.get("citation", "")) not in existing_ids
+                and c["chunk_id"] not in existing_ids
             ]
             if not candidates:
                 continue
@@ -2759,7 +3120,7 @@ class HybridRetriever:
             seed["similarity"] = max(0.42, float(seed.get("similarity", 0) or 0))
             seed["is_topic_seed"] = True
             additions.append(seed)
-            existing_ids.add(seed.get("chunk_id", seed.get("citation", "")))
+            existing_ids.add(seed["chunk_id"])
 
         return chunks + additions
 
@@ -2842,7 +3203,7 @@ class HybridRetriever:
         if not contract_chunks:
             return chunks
 
-        existing_ids = {c.get("chunk_id", c.get("citation", "")) for c in chunks}
+        existing_ids = {c["chunk_id"] if "chunk_id" in c else c.get("citation", "") for c in chunks}
         norm_class = re.sub(r"[^a-z0-9]+", "_", str(classification).lower()).strip("_")
         class_tokens = [t for t in norm_class.split("_") if len(t) > 2]
         preferred_table_ids: set[str] = set()
@@ -2853,7 +3214,7 @@ class HybridRetriever:
 
         scored: list[tuple[float, dict]] = []
         for chunk in contract_chunks:
-            chunk_id = chunk.get("chunk_id", chunk.get("citation", ""))
+            chunk_id = chunk["chunk_id"]
             if chunk_id in existing_ids:
                 continue
             if not chunk.get("table_refs"):
@@ -2971,12 +3332,12 @@ class HybridRetriever:
         if not contract_chunks:
             return chunks
 
-        existing_ids = {c.get("chunk_id", c.get("citation", "")) for c in chunks}
+        existing_ids = {c["chunk_id"] if "chunk_id" in c else c.get("citation", "") for c in chunks}
         candidates: list[tuple[float, dict]] = []
         for c in contract_chunks:
             if c.get("article_num") not in preferred:
                 continue
-            cid = c.get("chunk_id", c.get("citation", ""))
+            cid = c["chunk_id"]
             if cid in existing_ids:
                 continue
             text = _norm_text(c)
@@ -3120,11 +3481,11 @@ class HybridRetriever:
             tok for tok in re.findall(r"[a-z0-9]+", (query_text or "").lower())
             if len(tok) >= 3
         ]
-        existing_ids = {c.get("chunk_id", c.get("citation", "")) for c in chunks}
+        existing_ids = {c["chunk_id"] if "chunk_id" in c else c.get("citation", "") for c in chunks}
 
         candidates: list[tuple[float, dict]] = []
         for c in contract_chunks:
-            cid = c.get("chunk_id", c.get("citation", ""))
+            cid = c["chunk_id"]
             if cid in existing_ids:
                 continue
             text = _norm_text(c)
@@ -3166,6 +3527,7 @@ class HybridRetriever:
         contract_id: str = CONTRACT_ID,
         n_results: int = 5,
         preferred_articles: Optional[list[int]] = None,
+        seen_ids: Optional[set] = None,
     ) -> list:
         """
         Expand retrieval to include ALL chunks from the "winning" article.
@@ -3181,6 +3543,7 @@ class HybridRetriever:
             chunks: Initial retrieved chunks
             n_results: Number of top results to analyze for winning article
             preferred_articles: Topic-relevant article numbers to prioritize
+            seen_ids: Optional ids of `chunks`; appended chunk ids are added
 
         Returns:
             Original chunks + all chunks from winning article (up to max limit)
@@ -3188,19 +3551,23 @@ class HybridRetriever:
         if not CAG_ENABLE_FULL_ARTICLE_EXPANSION or not chunks:
             return chunks
 
+        # Limit total chunks to avoid context overflow; with no free slots
+        # there is nothing to add, so skip the article scan altogether.
+        available_slots = FULL_ARTICLE_MAX_CHUNKS - len(chunks)
+        if available_slots <= 0:
+            return chunks
+
         contract_chunks = self._load_all_chunks_for_contract(contract_id)
         if not contract_chunks:
             return chunks
 
         # Count article occurrences in top-N results
-        from collections import Counter
         top_chunks = chunks[:n_results]
-        article_counts = Counter()
-
+        article_counts: dict = {}
         for chunk in top_chunks:
             article_num = chunk.get('article_num')
             if article_num:
-                article_counts[article_num] += 1
+                article_counts[article_num] = article_counts.get(article_num, 0) + 1
 
         if not article_counts:
             return chunks
@@ -3224,22 +3591,26 @@ class HybridRetriever:
                     chosen_by_preference = True
                     break
 
-        # Fallback to the most frequent article.
+        # Fallback to the most frequent article (first seen wins ties).
         if winning_article is None:
-            winning_article, count = article_counts.most_common(1)[0]
+            for article_num, article_count in article_counts.items():
+                if article_count > count:
+                    winning_article, count = article_num, article_count
 
         # Only expand if the winning article appears enough times
         if (not chosen_by_preference) and count < FULL_ARTICLE_MIN_TOP_K_MATCH:
             return chunks
 
         # Get chunk IDs already in results
-        existing_ids = {c.get('chunk_id', c.get('citation', '')) for c in chunks}
+        if seen_ids is None:
+            existing_ids = {c["chunk_id"] if "chunk_id" in c else c.get("citation", "") for c in chunks}
+        else:
+            existing_ids = seen_ids
 
         # Fetch ALL chunks from the winning article
-        article_chunks = [
-            c for c in contract_chunks
-            if c.get('article_num') == winning_article
-            and c.get('chunk_id', c.get('citation', '')) not in existing_ids
+        article_rows = [
+            row for row in self._article_chunks_with_section_keys(contract_id, winning_article)
+            if row[2]["chunk_id"] not in existing_ids
         ]
 
         # Prioritize sections explicitly referenced by retrieved winning-article
@@ -3269,44 +3640,33 @@ class HybridRetriever:
                 or c.get("content")
                 or ""
             )
-            for m in re.finditer(r'\bSection\s+(\d+)\b', content_text, flags=re.IGNORECASE):
-                try:
-                    ref_sec = int(m.group(1))
-                except (TypeError, ValueError):
-                    continue
-                referenced_secs.add(ref_sec)
+            referenced_secs.update(int(m.group(1)) for m in _SECTION_REF_RE.finditer(content_text))
 
-        def _article_chunk_priority(c: dict) -> tuple:
-            raw = c.get("section_num")
-            try:
-                sec = int(raw) if raw is not None else None
-            except (TypeError, ValueError):
-                sec = None
+        def _article_chunk_priority(row: tuple) -> tuple:
+            sec, subsection, _ = row
             if sec is None:
-                return (3, 9999, 9999, str(c.get("subsection") or ""))
+                return (3, 9999, 9999, subsection)
             if sec in referenced_secs:
-                return (0, 0, sec, str(c.get("subsection") or ""))
+                return (0, 0, sec, subsection)
             if retrieved_secs:
                 distance = min(abs(sec - base) for base in retrieved_secs)
                 if distance <= 1:
-                    return (1, distance, sec, str(c.get("subsection") or ""))
-                return (2, distance, sec, str(c.get("subsection") or ""))
-            return (2, 999, sec, str(c.get("subsection") or ""))
+                    return (1, distance, sec, subsection)
+                return (2, distance, sec, subsection)
+            return (2, 999, sec, subsection)
 
-        article_chunks.sort(key=_article_chunk_priority)
-
-        # Limit total chunks to avoid context overflow
-        available_slots = FULL_ARTICLE_MAX_CHUNKS - len(chunks)
-        if available_slots <= 0:
-            return chunks
+        # Only the first available_slots rows are used; nsmallest keeps the
+        # stable order a full sort would give them.
+        top_rows = heapq.nsmallest(available_slots, article_rows, key=_article_chunk_priority)
 
         # Mark as full-article context and add
-        for chunk in article_chunks[:available_slots]:
+        for _, _, chunk in top_rows:
             chunk_copy = dict(chunk)
             chunk_copy['similarity'] = 0.4  # Lower score to indicate supplemental
             chunk_copy['is_full_article_context'] = True
             chunk_copy['winning_article'] = winning_article
             chunks.append(chunk_copy)
+            existing_ids.add(chunk_copy['chunk_id'])
 
         return chunks
 
@@ -3353,15 +3713,55 @@ class HybridRetriever:
         lou_detected = any(kw in query_padded for kw in lou_keywords)
         loa_detected = any(kw in query_padded for kw in loa_keywords)
         side_letter_detected = any(kw in query_padded for kw in side_letter_keywords)
+        # Empty or punctuation-only input has nothing for search to match.
+        has_search_text = any(ch.isalnum() for ch in query)
 
         if intent is None:
             # Use expanded query for intent classification
             intent = classify_intent(expanded_query, contract_id=contract_id)
 
+        # Repeated or near-duplicate questions that route identically reuse a
+        # recent result.
+        cache_embedding = None
+        cache_scope = None
+        result_cache_key = None
+        use_semantic_cache = (
+            self.semantic_cache is not None and self.vector_store is not None and has_search_text
+        )
+        if use_semantic_cache or (self.result_cache is not None and has_search_text):
+            cache_scope = (
+                contract_id,
+                n_results,
+                use_hybrid,
+                int(hours_worked or 0),
+                int(months_employed or 0),
+                lou_detected,
+                loa_detected,
+                side_letter_detected,
+                intent.intent_type,
+                intent.classification,
+                intent.topic,
+                intent.requires_escalation,
+                tuple(intent.relevant_articles or ()),
+                tuple(re.findall(r"\d+", query_lower)),
+            )
+        if self.result_cache is not None and cache_scope is not None:
+            result_cache_key = (query, cache_scope)
+            cached_result = self.result_cache.get(result_cache_key)
+            if cached_result is not None:
+                return cached_result
+        if use_semantic_cache:
+            cache_embedding = self.vector_store.embed_queries([query])[0]
+            cached_result = self.semantic_cache.get(cache_embedding, cache_scope)
+            if cached_result is not None:
+                if result_cache_key is not None:
+                    self.result_cache.put(result_cache_key, cached_result)
+                return cached_result
+
         # ===== PHASE 2: HYPOTHESIS LAYER (Rosetta Stone Brain) =====
         # Use LLM to predict likely section titles before searching
         hypothesis_result = None
-        if CAG_ENABLE_HYPOTHESIS_LAYER:
+        if CAG_ENABLE_HYPOTHESIS_LAYER and has_search_text:
             hypothesis_generator = get_hypothesis_generator()
             hypothesis_result = hypothesis_generator.generate_sync(query)
 
@@ -3405,6 +3805,18 @@ class HybridRetriever:
             side_letter_detected=side_letter_detected,
         )
 
+        if not has_search_text:
+            result["retrieval_policy"] = self._build_retrieval_policy(
+                chunks=[],
+                intent=intent,
+                search_mode="single_angle_hybrid" if use_hybrid else "single_angle_vector",
+                doc_type_filter=doc_type_filter,
+                explicit_articles=[],
+                query_expansions=expansions,
+                executed_stages=[],
+            )
+            return result
+
         if use_hybrid:
             region_id = resolve_contract_region_id(contract_id)
             self._ensure_hybrid_searcher()
@@ -3498,8 +3910,95 @@ class HybridRetriever:
                 contract_id=contract_id,
             )
 
+        if cache_embedding is not None:
+            self.semantic_cache.put(cache_embedding, cache_scope, result)
+        if result_cache_key is not None:
+            self.result_cache.put(result_cache_key, result)
+
         return result
 
+    def retrieve_batch(
+        self,
+        queries: list[str],
+        n_results: int = 5,
+        hours_worked: int = 0,
+        months_employed: int = 0,
+        use_hybrid: bool = True,
+        contract_id: str = CONTRACT_ID,
+        max_workers: int = MULTI_QUERY_MAX_WORKERS,
+    ) -> list[dict]:
+        """
+        Run retrieve() for several queries, concurrently.
+
+        Repeated queries are retrieved once (later copies get a deep copy of
+        the result). When vector search is on, every query's search text is
+        embedded in one batch up front so the concurrent searches hit the
+        vector store's embedding cache instead of each running the encoder.
+
+        Returns:
+            retrieve() results in the same order as `queries`
+        """
+        if not queries:
+            return []
+        ensure_contract_manifest(contract_id)
+        unique_queries = list(dict.fromkeys(queries))
+        if use_hybrid:
+            self._prefetch_query_embeddings(unique_queries, contract_id=contract_id)
+
+        retrieve_kwargs = dict(
+            n_results=n_results,
+            hours_worked=hours_worked,
+            months_employed=months_employed,
+            use_hybrid=use_hybrid,
+            contract_id=contract_id,
+        )
+        results_by_query: dict[str, dict] = {}
+        if len(unique_queries) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_queries))) as executor:
+                futures = {
+                    query: executor.submit(self.retrieve, query, **retrieve_kwargs)
+                    for query in unique_queries
+                }
+                for query, future in futures.items():
+                    results_by_query[query] = future.result()
+        else:
+            for query in unique_queries:
+                results_by_query[query] = self.retrieve(query, **retrieve_kwargs)
+
+        results = []
+        returned: set[str] = set()
+        for query in queries:
+            result = results_by_query[query]
+            results.append(copy.deepcopy(result) if query in returned else result)
+            returned.add(query)
+        return results
+
+    def _prefetch_query_embeddings(self, queries: list[str], contract_id: str = CONTRACT_ID) -> None:
+        """
+        Encode the vector-search text of several retrieve() queries in one batch.
+
+        Mirrors what HybridSearcher embeds for each query (the slang-expanded
+        query after its own expansion), plus the raw query when the semantic
+        cache will look it up. Skipped when vector search is off or the
+        hypothesis layer rewrites queries via LLM.
+        """
+        if HYBRID_VECTOR_WEIGHT <= 0 or CAG_ENABLE_HYPOTHESIS_LAYER:
+            return
+        self._ensure_hybrid_searcher()
+        if self.vector_store is None:
+            return
+        texts = []
+        for query in queries:
+            if not any(ch.isalnum() for ch in query):
+                continue
+            if self.semantic_cache is not None:
+                texts.append(query)
+            expanded_query, _ = expand_query(query, contract_id=contract_id)
+            texts.append(HybridSearcher.semantic_query(expanded_query))
+        texts = list(dict.fromkeys(texts))
+        if len(texts) > 1:
+            self.vector_store.embed_queries(texts)
+
     def multi_angle_retrieve(
         self,
         query: str,
@@ -3508,6 +4007,7 @@ class HybridRetriever:
         hours_worked: int = 0,
         months_employed: int = 0,
         contract_id: str = CONTRACT_ID,
+        debug: bool = False,
     ) -> dict:
         """
         Retrieve using multiple search angles from query interpretation.
@@ -3525,6 +4025,8 @@ class HybridRetriever:
             n_results: Number of results to return
             hours_worked: For wage lookups
             months_employed: For wage lookups
+            debug: Keep the reranker's scored chunk list and per-chunk scores
+                in the result (otherwise only its metrics are returned)
 
         Returns:
             dict with chunks, interpretation, and metadata
@@ -3552,98 +4054,120 @@ class HybridRetriever:
         # Limit to configured max
         search_queries = search_queries[:MULTI_QUERY_MAX_SEARCHES]
 
+        # Classify once per turn and share the intent with every retrieval
+        # angle and the merged-result expansion below.
+        if intent is None:
+            intent = interpretation.routed_intent
+        if intent is None:
+            expanded_query = " ".join([query] + interpretation.key_concepts)
+            intent = classify_intent(expanded_query, contract_id=contract_id)
+        interpretation.routed_intent = intent
+
         # Ensure vector store is initialized for direct HyDE searches
         self._ensure_hybrid_searcher()
 
         # ===== MULTI-ANGLE RETRIEVAL =====
         all_chunks = []
-        chunk_scores = {}  # chunk_id -> best score
+        all_scores = []  # similarity of all_chunks[i], kept in step with it
+        chunk_positions = {}  # chunk_id -> index of its best-scoring copy in all_chunks
 
         # Add explicit article lookups first (highest priority)
         if interpretation.explicit_articles:
-            self._load_all_chunks(contract_id=contract_id)
             for article_num in interpretation.explicit_articles:
-                article_chunks = [
-                    c for c in self._all_chunks
-                    if c.get('article_num') == article_num
-                    and c.get("contract_id") == contract_id
-                ]
-                # Sort by section number
-                article_chunks.sort(key=lambda x: (
-                    x.get('section_num') or 0,
-                    x.get('subsection') or ''
-                ))
+                article_chunks = self._article_chunks_in_section_order(contract_id, article_num)
                 # Add with high score
                 for chunk in article_chunks[:MULTI_QUERY_RESULTS_PER_SEARCH]:
-                    chunk_id = chunk.get('chunk_id', chunk.get('citation', ''))
+                    chunk_id = chunk['chunk_id']
                     chunk_copy = dict(chunk)
                     chunk_copy['similarity'] = 0.95  # High score for explicit reference
                     chunk_copy['search_angle'] = f"explicit_article_{article_num}"
 
-                    if chunk_id not in chunk_scores:
-                        chunk_scores[chunk_id] = chunk_copy
+                    idx = chunk_positions.get(chunk_id)
+                    if idx is None:
+                        chunk_positions[chunk_id] = len(all_chunks)
                         all_chunks.append(chunk_copy)
-                    elif chunk_copy['similarity'] > chunk_scores[chunk_id].get('similarity', 0):
+                        all_scores.append(0.95)
+                    elif 0.95 > all_scores[idx]:
                         # Update with better score
-                        idx = next(i for i, c in enumerate(all_chunks)
-                                   if c.get('chunk_id', c.get('citation', '')) == chunk_id)
                         all_chunks[idx] = chunk_copy
-                        chunk_scores[chunk_id] = chunk_copy
-
-        # Run retrieval for each search angle
-        for i, search_query in enumerate(search_queries):
-            # For hypothetical answers (HyDE), use direct vector search
-            # This avoids score distortion from hybrid fusion
-            is_hypothetical = i > 0 and i <= len(interpretation.hypothetical_answers)
-
-            if is_hypothetical and self.vector_store:
-                # Direct vector search for hypothetical answers
-                region_id = resolve_contract_region_id(contract_id)
-                angle_chunks = self.vector_store.search(
-                    query=search_query,
-                    n_results=MULTI_QUERY_RESULTS_PER_SEARCH,
-                    contract_id=contract_id,
-                    region_id=region_id,
-                )
-                angle_result = {"chunks": angle_chunks}
-            else:
-                # Use standard retrieval for original query and search queries
-                angle_result = self.retrieve(
-                    query=search_query,
-                    intent=intent,
+                        all_scores[idx] = 0.95
+
+        # Run retrieval for each search angle. Angles are independent and
+        # I/O-bound (embedding + vector store), so fan them out and merge the
+        # results back in angle order to keep tie-breaking deterministic.
+        angle_specs = [
+            (i, search_query, i > 0 and i <= len(interpretation.hypothetical_answers))
+            for i, search_query in enumerate(search_queries)
+        ]
+
+        angle_chunk_lists: list = [None] * len(angle_specs)
+
+        # Hypothetical answers (HyDE) go straight to the vector store; embed
+        # them in one batch and search with the shared filters.
+        if self.vector_store:
+            self._prefetch_angle_embeddings(angle_specs, contract_id)
+            hypothetical_specs = [spec for spec in angle_specs if spec[2]]
+            if hypothetical_specs:
+                batch_results = self.vector_store.search_batch(
+                    queries=[search_query for _, search_query, _ in hypothetical_specs],
                     n_results=MULTI_QUERY_RESULTS_PER_SEARCH,
-                    hours_worked=hours_worked,
-                    months_employed=months_employed,
-                    use_hybrid=True,
                     contract_id=contract_id,
+                    region_id=resolve_contract_region_id(contract_id),
                 )
+                for (i, _, _), angle_chunks in zip(hypothetical_specs, batch_results):
+                    angle_chunk_lists[i] = angle_chunks
 
-            # Merge chunks with score tracking
-            for chunk in angle_result.get('chunks', []):
-                chunk_id = chunk.get('chunk_id', chunk.get('citation', ''))
-                chunk_copy = dict(chunk)
-                chunk_copy['search_angle'] = f"angle_{i}_{search_query[:30]}"
-
-                if chunk_id not in chunk_scores:
-                    chunk_scores[chunk_id] = chunk_copy
-                    all_chunks.append(chunk_copy)
-                elif chunk_copy.get('similarity', 0) > chunk_scores[chunk_id].get('similarity', 0):
+        angle_kwargs = dict(
+            intent=intent,
+            hours_worked=hours_worked,
+            months_employed=months_employed,
+            contract_id=contract_id,
+        )
+        pending_specs = [spec for spec in angle_specs if angle_chunk_lists[spec[0]] is None]
+        if len(pending_specs) > 1:
+            max_workers = min(MULTI_QUERY_MAX_WORKERS, len(pending_specs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    i: executor.submit(self._run_search_angle, search_query, is_hypothetical, **angle_kwargs)
+                    for i, search_query, is_hypothetical in pending_specs
+                }
+                for i, future in futures.items():
+                    angle_chunk_lists[i] = future.result()
+        else:
+            for i, search_query, is_hypothetical in pending_specs:
+                angle_chunk_lists[i] = self._run_search_angle(search_query, is_hypothetical, **angle_kwargs)
+
+        for i, angle_chunks in enumerate(angle_chunk_lists):
+            # Merge chunks with score tracking. Angle results are fresh dicts
+            # owned by this call, so tag them in place; the angle's query text
+            # is available as result["search_queries"][i].
+            angle_tag = f"angle_{i}"
+            # Search backends always shape results with a chunk_id.
+            angle_ids = [c['chunk_id'] for c in angle_chunks]
+            angle_sims = [c.get('similarity', 0) for c in angle_chunks]
+            for chunk, chunk_id, similarity in zip(angle_chunks, angle_ids, angle_sims):
+                chunk['search_angle'] = angle_tag
+
+                idx = chunk_positions.get(chunk_id)
+                if idx is None:
+                    chunk_positions[chunk_id] = len(all_chunks)
+                    all_chunks.append(chunk)
+                    all_scores.append(similarity)
+                elif similarity > all_scores[idx]:
                     # Update with better score
-                    idx = next((i for i, c in enumerate(all_chunks)
-                                if c.get('chunk_id', c.get('citation', '')) == chunk_id), None)
-                    if idx is not None:
-                        all_chunks[idx] = chunk_copy
-                        chunk_scores[chunk_id] = chunk_copy
+                    all_chunks[idx] = chunk
+                    all_scores[idx] = similarity
 
         # Sort by similarity and limit results
-        all_chunks.sort(key=lambda x: x.get('similarity', 0), reverse=True)
-        final_chunks = all_chunks[:MULTI_QUERY_TOTAL_RESULTS]
+        top_positions = heapq.nlargest(
+            MULTI_QUERY_TOTAL_RESULTS, range(len(all_chunks)), key=all_scores.__getitem__
+        )
+        final_chunks = [all_chunks[idx] for idx in top_positions]
 
         # ===== PHASE 5: LLM RERANKING =====
         # Reorder chunks by semantic relevance before expansion
         reranker_result = None
         if CAG_ENABLE_RERANKER and not self._should_skip_reranker_for_query(query):
-            from backend.retrieval.reranker import get_reranker
             reranker_result = get_reranker().rerank(
                 query=query,
                 chunks=final_chunks,
@@ -3651,13 +4175,13 @@ class HybridRetriever:
             )
             if reranker_result.success:
                 final_chunks = reranker_result.chunks
+            if not debug:
+                # Callers only read latency/position metrics; don't keep a
+                # second copy of the pre-expansion chunk list alive.
+                reranker_result = replace(reranker_result, chunks=[], scores={})
         # ===== END RERANKING =====
 
         # Apply full article expansion on merged results
-        if intent is None:
-            expanded_query = " ".join([query] + interpretation.key_concepts)
-            intent = classify_intent(expanded_query, contract_id=contract_id)
-
         retrieval_plan = self._build_retrieval_plan(
             intent=intent,
             search_mode="multi_angle_interpreted",
@@ -3686,6 +4210,7 @@ class HybridRetriever:
             "query_expansions": [],
             "interpretation": interpretation,  # Include interpretation for debugging
             "search_angles_used": len(search_queries),
+            "search_queries": search_queries,
             "explicit_articles_fetched": interpretation.explicit_articles,
             "reranker_result": reranker_result,  # Include reranker metrics
             "retrieval_plan": retrieval_plan,
@@ -3732,9 +4257,61 @@ class HybridRetriever:
 
         return result
 
-    def _load_all_chunks(self, contract_id: str = CONTRACT_ID):
-        """Load all chunks for direct article lookup."""
-        self._all_chunks = self._load_all_chunks_for_contract(contract_id)
+    def _prefetch_angle_embeddings(self, angle_specs: list, contract_id: str = CONTRACT_ID) -> None:
+        """
+        Encode every angle's vector-search text in one embedding batch.
+
+        HyDE angles are searched with their own text; hybrid angles embed the
+        slang-expanded query after HybridSearcher's own expansion. Warming the
+        vector store's embedding cache here means the per-angle searches that
+        follow (some on worker threads) don't each run the encoder. Skipped
+        when the hypothesis layer is on, since it rewrites the query via LLM.
+        """
+        texts = [search_query for _, search_query, is_hypothetical in angle_specs if is_hypothetical]
+        if HYBRID_VECTOR_WEIGHT > 0 and not CAG_ENABLE_HYPOTHESIS_LAYER:
+            for _, search_query, is_hypothetical in angle_specs:
+                if is_hypothetical:
+                    continue
+                if self.semantic_cache is not None:
+                    texts.append(search_query)
+                expanded_query, _ = expand_query(search_query, contract_id=contract_id)
+                texts.append(HybridSearcher.semantic_query(expanded_query))
+        texts = list(dict.fromkeys(texts))
+        if len(texts) > 1:
+            self.vector_store.embed_queries(texts)
+
+    def _run_search_angle(
+        self,
+        search_query: str,
+        is_hypothetical: bool,
+        intent: Optional[QueryIntent],
+        hours_worked: int = 0,
+        months_employed: int = 0,
+        contract_id: str = CONTRACT_ID,
+    ) -> list:
+        """Run one multi-angle search and return its chunks."""
+        # For hypothetical answers (HyDE), use direct vector search
+        # This avoids score distortion from hybrid fusion
+        if is_hypothetical and self.vector_store:
+            region_id = resolve_contract_region_id(contract_id)
+            return self.vector_store.search(
+                query=search_query,
+                n_results=MULTI_QUERY_RESULTS_PER_SEARCH,
+                contract_id=contract_id,
+                region_id=region_id,
+            )
+
+        # Use standard retrieval for original query and search queries
+        angle_result = self.retrieve(
+            query=search_query,
+            intent=intent,
+            n_results=MULTI_QUERY_RESULTS_PER_SEARCH,
+            hours_worked=hours_worked,
+            months_employed=months_employed,
+            use_hybrid=True,
+            contract_id=contract_id,
+        )
+        return angle_result.get("chunks", [])
 
     @staticmethod
     def _should_skip_reranker_for_query(query: str) -> bool:
@@ -3804,6 +4381,7 @@ def main():
     # Test hybrid retrieval
     print("\n\n--- Testing Hybrid Retrieval ---")
     retriever = HybridRetriever()
+    retriever.preload()
     
     test_cases = [
         ("What is the starting pay for a courtesy clerk?", 0, 0),
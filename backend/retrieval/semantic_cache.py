@@ -0,0 +1,141 @@
+"""
+Semantic Query Cache - Reuses retrieval results for near-duplicate questions.
+
+Exact-text caching misses rephrasings ("float days" vs "floaters"). This cache
+compares the incoming query embedding against recently cached query
+embeddings and returns the stored result when cosine similarity clears a
+threshold.
+
+Entries are partitioned by a caller-supplied scope key (contract, routed
+intent, tenure, numbers mentioned, ...) so a near-duplicate phrasing can only
+hit a result that was retrieved under identical routing.
+"""
+
+import bisect
+import copy
+import threading
+import time
+from collections import deque
+from typing import Any, Hashable, Optional
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.config import (
+    RETRIEVAL_SEMANTIC_CACHE_THRESHOLD,
+    RETRIEVAL_SEMANTIC_CACHE_MAX_ENTRIES,
+    RETRIEVAL_SEMANTIC_CACHE_TTL_SECONDS,
+)
+
+
+def _normalize(vector):
+    """float32 unit vector (zero vectors are returned unscaled)."""
+    import numpy as np  # sentence-transformers dependency
+
+    vec = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vec))
+    if not norm:
+        return vec
+    return vec / norm
+
+
+class _ScopeEntries:
+    """One scope's entries, oldest first, with their unit vectors stacked."""
+
+    __slots__ = ("stored_at", "vectors", "results", "_matrix")
+
+    def __init__(self) -> None:
+        self.stored_at: list[float] = []
+        self.vectors: list = []
+        self.results: list = []
+        self._matrix = None
+
+    def append(self, stored_at: float, vector, result: Any) -> None:
+        self.stored_at.append(stored_at)
+        self.vectors.append(vector)
+        self.results.append(result)
+        self._matrix = None
+
+    def pop_oldest(self) -> None:
+        del self.stored_at[0], self.vectors[0], self.results[0]
+        self._matrix = None
+
+    def matrix(self):
+        """(n, dim) float32 matrix of unit vectors, rebuilt after changes."""
+        if self._matrix is None:
+            import numpy as np
+
+            self._matrix = np.vstack(self.vectors)
+        return self._matrix
+
+
+class SemanticQueryCache:
+    """Bounded ring buffer of (scope, unit query vector, result) entries.
+
+    Entries are grouped per scope so a lookup is one matrix-vector product
+    over that scope's unit vectors instead of a Python loop over every entry.
+    """
+
+    def __init__(
+        self,
+        threshold: float = RETRIEVAL_SEMANTIC_CACHE_THRESHOLD,
+        maxsize: int = RETRIEVAL_SEMANTIC_CACHE_MAX_ENTRIES,
+        ttl: float = RETRIEVAL_SEMANTIC_CACHE_TTL_SECONDS,
+    ):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Insertion order across scopes, for evicting the globally oldest entry.
+        self._order: deque = deque()
+        self._scopes: dict[Hashable, _ScopeEntries] = {}
+        self._lock = threading.Lock()
+
+    def get(self, embedding: list, scope: Hashable) -> Optional[Any]:
+        """Return a copy of the closest cached result in `scope`, if close enough."""
+        query_vec = _normalize(embedding)
+        now = time.monotonic()
+        best_result = None
+        with self._lock:
+            entries = self._scopes.get(scope)
+            if entries is None:
+                return None
+            # stored_at is ascending, so unexpired entries are a suffix.
+            first = bisect.bisect_left(entries.stored_at, now - self.ttl)
+            if first >= len(entries.results):
+                return None
+            matrix = entries.matrix()
+            if matrix.shape[1] != query_vec.shape[0]:
+                return None
+            sims = matrix[first:] @ query_vec
+            # Ties go to the most recent entry.
+            best = len(sims) - 1 - int(sims[::-1].argmax())
+            if sims[best] >= self.threshold:
+                best_result = entries.results[first + best]
+        if best_result is None:
+            return None
+        return copy.deepcopy(best_result)
+
+    def put(self, embedding: list, scope: Hashable, result: Any) -> None:
+        """Store a private copy of `result` for later near-duplicate lookups."""
+        vector = _normalize(embedding)
+        result = copy.deepcopy(result)
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            while len(self._order) >= self.maxsize:
+                oldest_scope = self._order.popleft()
+                oldest = self._scopes[oldest_scope]
+                oldest.pop_oldest()
+                if not oldest.results:
+                    del self._scopes[oldest_scope]
+            entries = self._scopes.get(scope)
+            if entries is None:
+                entries = self._scopes[scope] = _ScopeEntries()
+            entries.append(time.monotonic(), vector, result)
+            self._order.append(scope)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._order.clear()
+            self._scopes.clear()
@@ -5,7 +5,13 @@ Supports PostgreSQL/pgvector when available and falls back to ChromaDB for
 prototype or no-database environments.
 """
 
-import json
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
@@ -13,12 +19,21 @@ from dataclasses import dataclass
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from backend.config import (
-    CHROMA_PERSIST_DIR, EMBEDDING_MODEL, COLLECTION_NAME,
-    TOP_K_RESULTS, SIMILARITY_THRESHOLD, CONTRACT_ID
+    CHROMA_PERSIST_DIR, EMBEDDING_MODEL, COLLECTION_NAME, CHROMA_HNSW_METADATA,
+    EMBEDDING_BACKEND, EMBEDDING_MODEL_FILE, EMBEDDING_DEVICE,
+    EMBEDDING_CACHE_MAX_ENTRIES, EMBEDDING_CACHE_TTL_SECONDS, EMBEDDING_ENCODE_BATCH_SIZE,
+    EMBEDDING_DISK_CACHE_ENABLED, EMBEDDING_DISK_CACHE_FILE, EMBEDDING_DISK_CACHE_MAX_ROWS,
+    PGVECTOR_HNSW_EF_SEARCH, PGVECTOR_EXACT_SEARCH_ABOVE,
+    PGVECTOR_BINARY_QUANTIZATION, PGVECTOR_BINARY_RERANK_FACTOR,
+    TOP_K_RESULTS, SIMILARITY_THRESHOLD, CONTRACT_ID,
+    VECTOR_SEARCH_SEMANTIC_CACHE_ENABLED, VECTOR_SEARCH_SEMANTIC_CACHE_THRESHOLD,
+    VECTOR_SEARCH_SEMANTIC_CACHE_MAX_ENTRIES, VECTOR_SEARCH_SEMANTIC_CACHE_TTL_SECONDS,
 )
-from backend.chunk_files import resolve_chunk_file
+from backend.chunk_files import parse_json_file, resolve_chunk_file
 from backend.contracts import resolve_contract_region_id
 from backend.platform.settings import get_platform_settings
+from backend.retrieval.embedding_cache import PersistentEmbeddingCache
+from backend.retrieval.semantic_cache import SemanticQueryCache
 
 # Lazy imports for optional dependencies
 chromadb = None
@@ -27,7 +42,9 @@ sqlalchemy_create_engine = None
 sqlalchemy_sessionmaker = None
 sqlalchemy_select = None
 sqlalchemy_func = None
+sqlalchemy_text = None
 ChunkEmbedding = None
+CHUNK_EMBEDDING_DIM = None
 
 
 def _load_dependencies():
@@ -41,19 +58,260 @@ def _load_dependencies():
         SentenceTransformer = _ST
 
 
+def _select_embedding_device() -> str:
+    """EMBEDDING_DEVICE if set, else the first available of cuda, mps, cpu."""
+    if EMBEDDING_DEVICE:
+        return EMBEDDING_DEVICE
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _load_embedder():
+    """Load EMBEDDING_MODEL on the configured sentence-transformers backend and device."""
+    device = _select_embedding_device()
+    print(f"Loading embedding model: {EMBEDDING_MODEL} ({EMBEDDING_BACKEND}, device={device})")
+    if EMBEDDING_BACKEND == "torch":
+        return SentenceTransformer(EMBEDDING_MODEL, device=device)
+    model_kwargs = {"file_name": EMBEDDING_MODEL_FILE} if EMBEDDING_MODEL_FILE else None
+    return SentenceTransformer(
+        EMBEDDING_MODEL, device=device, backend=EMBEDDING_BACKEND, model_kwargs=model_kwargs
+    )
+
+
+def _embedding_model_key() -> str:
+    """Identity of the loaded encoder; non-torch backends produce different vectors."""
+    if EMBEDDING_BACKEND == "torch":
+        return EMBEDDING_MODEL
+    return f"{EMBEDDING_MODEL}|{EMBEDDING_BACKEND}|{EMBEDDING_MODEL_FILE}"
+
+
 def _load_sqlalchemy():
-    global sqlalchemy_create_engine, sqlalchemy_sessionmaker, sqlalchemy_select, sqlalchemy_func, ChunkEmbedding
+    global sqlalchemy_create_engine, sqlalchemy_sessionmaker, sqlalchemy_select, sqlalchemy_func, sqlalchemy_text, ChunkEmbedding
+    global CHUNK_EMBEDDING_DIM
     if sqlalchemy_create_engine is None:
-        from sqlalchemy import create_engine as _create_engine, func as _func, select as _select
+        from sqlalchemy import create_engine as _create_engine, func as _func, select as _select, text as _text
         from sqlalchemy.orm import sessionmaker as _sessionmaker
 
-        from backend.platform.models import ChunkEmbedding as _ChunkEmbedding
+        from backend.platform.models import CHUNK_EMBEDDING_DIM as _CHUNK_EMBEDDING_DIM, ChunkEmbedding as _ChunkEmbedding
 
         sqlalchemy_create_engine = _create_engine
         sqlalchemy_sessionmaker = _sessionmaker
         sqlalchemy_select = _select
         sqlalchemy_func = _func
+        sqlalchemy_text = _text
         ChunkEmbedding = _ChunkEmbedding
+        CHUNK_EMBEDDING_DIM = _CHUNK_EMBEDDING_DIM
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU + TTL cache of query embeddings.
+
+    Keys are a truncated SHA-256 of the whitespace-stripped, lowercased query
+    (the embedding model is uncased), so repeated questions and repeated
+    search angles skip the encoder forward pass.
+    """
+
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_MAX_ENTRIES, ttl: float = EMBEDDING_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha256(text.strip().lower().encode("utf-8")).digest()[:16]
+
+    def get(self, text: str) -> Optional[list]:
+        key = self._key(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, embedding = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, text: str, embedding: list) -> None:
+        key = self._key(text)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _encode_queries(embedder, cache: EmbeddingCache, queries: list[str]) -> list[list]:
+    """Encode queries through the cache, batch-encoding only the misses."""
+    embeddings = [cache.get(query) for query in queries]
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if missing:
+        encoded = embedder.encode([queries[i] for i in missing])
+        for i, embedding in zip(missing, encoded):
+            embeddings[i] = embedding.tolist()
+            cache.put(queries[i], embeddings[i])
+    return embeddings
+
+
+def _open_document_embedding_cache() -> Optional[PersistentEmbeddingCache]:
+    """Open the on-disk chunk embedding cache, or None when disabled/unavailable."""
+    if not EMBEDDING_DISK_CACHE_ENABLED:
+        return None
+    try:
+        return PersistentEmbeddingCache(
+            EMBEDDING_DISK_CACHE_FILE,
+            model_name=_embedding_model_key(),
+            max_rows=EMBEDDING_DISK_CACHE_MAX_ROWS,
+        )
+    except Exception as exc:
+        print(f"Warning: chunk embedding cache unavailable: {exc}")
+        return None
+
+
+def _encode_documents(
+    embedder,
+    texts: list[str],
+    cache: Optional[PersistentEmbeddingCache] = None,
+    as_lists: bool = True,
+) -> list:
+    """
+    Encode chunk texts in batched forward passes (used when indexing).
+
+    With a cache, only texts without a stored embedding are encoded, and
+    their embeddings are stored for the next rebuild. With as_lists=False,
+    the result is a single (len(texts), dim) float32 array instead of lists
+    (cached and freshly encoded rows alike, so a store never receives a mix
+    of row types), skipping the per-float list conversion.
+    """
+    if not texts:
+        return []
+    embeddings = cache.get_many(texts) if cache is not None else [None] * len(texts)
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if missing:
+        missing_texts = [texts[i] for i in missing]
+        encoded = embedder.encode(missing_texts, batch_size=EMBEDDING_ENCODE_BATCH_SIZE)
+        fresh = [embedding.tolist() for embedding in encoded] if as_lists else list(encoded)
+        for i, embedding in zip(missing, fresh):
+            embeddings[i] = embedding
+        if cache is not None:
+            cache.put_many(missing_texts, fresh)
+    if not as_lists:
+        import numpy as np  # sentence-transformers dependency
+
+        return np.asarray(embeddings, dtype=np.float32)
+    return embeddings
+
+
+# Sort key for boosted chunk rankings.
+_SIMILARITY_KEY = itemgetter("similarity")
+
+_ARTICLE_REF_RE = re.compile(r'article\s*(\d+)')
+_SECTION_REF_RE = re.compile(r'section\s*(\d+)')
+
+
+def _search_cache_scope(query: str, n_results: int, filters: dict) -> tuple:
+    """
+    Scope under which two searches may share a result list.
+
+    Besides the filters, backends boost on article/section numbers written in
+    the query text, so those references are part of the scope too.
+    """
+    query_lower = query.lower()
+    boost_articles = filters.get("boost_articles")
+    return (
+        n_results,
+        filters.get("contract_id"),
+        filters.get("region_id"),
+        filters.get("classification"),
+        filters.get("topic"),
+        filters.get("urgency_tier"),
+        filters.get("doc_type"),
+        frozenset(boost_articles) if boost_articles else frozenset(),
+        frozenset(_ARTICLE_REF_RE.findall(query_lower)),
+        frozenset(_SECTION_REF_RE.findall(query_lower)),
+    )
+
+
+def _as_list(value, default: list, sep: Optional[str] = None) -> list:
+    """List form of a chunk field stored as a list or a (sep-joined) string."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str) and value:
+        return value.split(sep) if sep else [value]
+    return default
+
+
+def _normalize_chunk(chunk: dict) -> dict:
+    """
+    Return a copy of `chunk` with index metadata in canonical form.
+
+    List fields (topics, applies_to, worker_questions, alternative_names) are
+    lists and every metadata key is present, so building a store row is plain
+    key access. Idempotent: normalizing a normalized chunk changes nothing.
+    """
+    return {
+        **chunk,
+        'contract_id': chunk.get('contract_id', ''),
+        'region_id': chunk.get('region_id', ''),
+        'article_num': chunk.get('article_num') or 0,
+        'article_title': chunk.get('article_title', ''),
+        'section_num': chunk.get('section_num') or 0,
+        'subsection': chunk.get('subsection') or '',
+        'citation': chunk.get('citation', ''),
+        'parent_context': chunk.get('parent_context', ''),
+        'doc_type': chunk.get('doc_type', 'cba'),
+        # Handle both old format (topic_tags) and new format (topics)
+        'topics': _as_list(chunk.get('topics', chunk.get('topic_tags', [])), [], ','),
+        'applies_to': _as_list(chunk.get('applies_to', ['all']), ['all'], ','),
+        'summary': chunk.get('summary') or '',
+        'is_definition': chunk.get('is_definition', False),
+        'is_exception': chunk.get('is_exception', False),
+        'hire_date_sensitive': chunk.get('hire_date_sensitive', False),
+        'is_high_stakes': chunk.get('is_high_stakes', False),
+        'worker_questions': _as_list(chunk.get('worker_questions', []), []),
+        'alternative_names': _as_list(chunk.get('alternative_names', []), []),
+    }
+
+
+def _chunk_metadata(chunk: dict) -> dict:
+    """Flat store metadata (str, int, float, bool only) for a normalized chunk."""
+    return {
+        'contract_id': chunk['contract_id'],
+        'region_id': chunk['region_id'],
+        'article_num': chunk['article_num'],
+        'article_title': chunk['article_title'],
+        'section_num': chunk['section_num'],
+        'subsection': chunk['subsection'],
+        'citation': chunk['citation'],
+        'parent_context': chunk['parent_context'],
+        'doc_type': chunk['doc_type'],
+        # Enriched metadata
+        'applies_to': ','.join(chunk['applies_to']),
+        'topics': ','.join(chunk['topics']),
+        'summary': chunk['summary'],
+        'is_definition': chunk['is_definition'],
+        'is_exception': chunk['is_exception'],
+        'hire_date_sensitive': chunk['hire_date_sensitive'],
+        'is_high_stakes': chunk['is_high_stakes'],
+        # Phase 4: Concept-indexed fields for vocabulary bridging
+        'worker_questions': '|'.join(chunk['worker_questions']),
+        'alternative_names': '|'.join(chunk['alternative_names']),
+    }
 
 
 @dataclass
@@ -78,10 +336,10 @@ def _apply_result_boosts(
     boost_articles: list | None = None,
     n_results: int = 5,
 ) -> list[dict]:
-    import re
-
-    article_refs = re.findall(r'article\s*(\d+)', query.lower())
-    section_refs = re.findall(r'section\s*(\d+)', query.lower())
+    query_lower = query.lower()
+    article_refs = set(_ARTICLE_REF_RE.findall(query_lower))
+    section_refs = set(_SECTION_REF_RE.findall(query_lower))
+    boost_article_set = set(boost_articles) if boost_articles else None
     effective_region_id = str(region_id or resolve_contract_region_id(contract_id)) if contract_id else None
     ranked = []
     for chunk in chunks:
@@ -96,7 +354,7 @@ def _apply_result_boosts(
             similarity += 0.3
         if section_refs and str(chunk.get("section_num", 0)) in section_refs:
             similarity += 0.1
-        if boost_articles and chunk.get("article_num", 0) in boost_articles:
+        if boost_article_set and chunk.get("article_num", 0) in boost_article_set:
             similarity += 0.2
         if classification:
             applies_to = str(chunk.get("applies_to") or "")
@@ -110,18 +368,37 @@ def _apply_result_boosts(
             similarity += 0.1
         chunk["similarity"] = similarity
         ranked.append(chunk)
-    ranked.sort(key=lambda item: item["similarity"], reverse=True)
+    ranked.sort(key=_SIMILARITY_KEY, reverse=True)
     return ranked[:n_results]
 
 
+# pgvector's upper bound for hnsw.ef_search.
+_PGVECTOR_MAX_EF_SEARCH = 1000
+
+
+def _ann_candidate_limits(n_results: int) -> tuple[int, int]:
+    """
+    (candidates kept after reranking, rows fetched from the index scan).
+
+    With binary quantization the Hamming shortlist is
+    PGVECTOR_BINARY_RERANK_FACTOR times the candidate count; otherwise both
+    are the same.
+    """
+    candidate_limit = max(n_results * 3, 15)
+    if PGVECTOR_BINARY_QUANTIZATION:
+        return candidate_limit, candidate_limit * PGVECTOR_BINARY_RERANK_FACTOR
+    return candidate_limit, candidate_limit
+
+
 class PgVectorContractVectorStore:
     def __init__(self, postgres_url: str):
         _load_dependencies()
         _load_sqlalchemy()
         self.engine = sqlalchemy_create_engine(postgres_url, future=True, pool_pre_ping=True)
         self.session_factory = sqlalchemy_sessionmaker(bind=self.engine, autoflush=False, autocommit=False, future=True)
-        print(f"Loading embedding model: {EMBEDDING_MODEL}")
-        self.embedder = SentenceTransformer(EMBEDDING_MODEL)
+        self.embedder = _load_embedder()
+        self.embedding_cache = EmbeddingCache()
+        self.document_embedding_cache = _open_document_embedding_cache()
 
     def reset_collection(self):
         with self.session_factory() as db:
@@ -132,11 +409,15 @@ class PgVectorContractVectorStore:
         if not chunks:
             return 0
         added = 0
+        all_embeddings = _encode_documents(
+            self.embedder,
+            [chunk["content"] for chunk in chunks],
+            cache=self.document_embedding_cache,
+        )
         with self.session_factory() as db:
             for i in range(0, len(chunks), batch_size):
                 batch = chunks[i:i + batch_size]
-                for chunk in batch:
-                    embedding = self.embedder.encode(chunk["content"]).tolist()
+                for chunk, embedding in zip(batch, all_embeddings[i:i + batch_size]):
                     db.add(
                         ChunkEmbedding(
                             id=str(chunk.get("chunk_id") or ""),
@@ -144,26 +425,7 @@ class PgVectorContractVectorStore:
                             document_id=str(chunk.get("document_id")) if chunk.get("document_id") else None,
                             chunk_index=int(chunk.get("chunk_index") or chunk.get("section_num") or 0),
                             chunk_text=chunk.get("content_with_tables", chunk["content"]),
-                            metadata_json={
-                                "contract_id": chunk.get("contract_id", ""),
-                                "region_id": chunk.get("region_id", ""),
-                                "article_num": chunk.get("article_num") or 0,
-                                "article_title": chunk.get("article_title", ""),
-                                "section_num": chunk.get("section_num") or 0,
-                                "subsection": chunk.get("subsection") or "",
-                                "citation": chunk.get("citation", ""),
-                                "parent_context": chunk.get("parent_context", ""),
-                                "doc_type": chunk.get("doc_type", "cba"),
-                                "applies_to": ",".join(chunk.get("applies_to", ["all"])) if isinstance(chunk.get("applies_to"), list) else str(chunk.get("applies_to") or "all"),
-                                "topics": ",".join(chunk.get("topics", chunk.get("topic_tags", []))) if isinstance(chunk.get("topics", chunk.get("topic_tags", [])), list) else str(chunk.get("topics", chunk.get("topic_tags", "")) or ""),
-                                "summary": chunk.get("summary") or "",
-                                "is_definition": chunk.get("is_definition", False),
-                                "is_exception": chunk.get("is_exception", False),
-                                "hire_date_sensitive": chunk.get("hire_date_sensitive", False),
-                                "is_high_stakes": chunk.get("is_high_stakes", False),
-                                "worker_questions": "|".join(chunk.get("worker_questions", [])) if isinstance(chunk.get("worker_questions"), list) else str(chunk.get("worker_questions") or ""),
-                                "alternative_names": "|".join(chunk.get("alternative_names", [])) if isinstance(chunk.get("alternative_names"), list) else str(chunk.get("alternative_names") or ""),
-                            },
+                            metadata_json=_chunk_metadata(chunk),
                             embedding=embedding,
                         )
                     )
@@ -171,6 +433,9 @@ class PgVectorContractVectorStore:
                 added += len(batch)
         return added
 
+    def embed_queries(self, queries: list[str]) -> list[list]:
+        return _encode_queries(self.embedder, self.embedding_cache, list(queries))
+
     def search(
         self,
         query: str,
@@ -182,9 +447,11 @@ class PgVectorContractVectorStore:
         urgency_tier: str = None,
         doc_type: str = None,
         boost_articles: list = None,
+        query_embedding: list = None,
     ) -> list[dict]:
         n_results = n_results or TOP_K_RESULTS
-        query_embedding = self.embedder.encode(query).tolist()
+        if query_embedding is None:
+            query_embedding = self.embed_queries([query])[0]
         with self.session_factory() as db:
             stmt = sqlalchemy_select(ChunkEmbedding)
             if contract_id:
@@ -197,7 +464,26 @@ class PgVectorContractVectorStore:
                 stmt = stmt.where(ChunkEmbedding.metadata_json["topics"].astext.contains(str(topic)))
 
             if hasattr(ChunkEmbedding.embedding, "cosine_distance"):
-                stmt = stmt.order_by(ChunkEmbedding.embedding.cosine_distance(query_embedding)).limit(max(n_results * 3, 15))
+                candidate_limit, scan_limit = _ann_candidate_limits(n_results)
+                if PGVECTOR_BINARY_QUANTIZATION:
+                    # Shortlist by Hamming distance over 1-bit codes; the exact
+                    # cosine below reranks the shortlist in full precision.
+                    # The expression must match the bit(CHUNK_EMBEDDING_DIM)
+                    # index exactly, or Postgres scans and quantizes every row.
+                    if len(query_embedding) != CHUNK_EMBEDDING_DIM:
+                        raise ValueError(
+                            f"Query embedding has {len(query_embedding)} dimensions but "
+                            f"chunk_embeddings.embedding is vector({CHUNK_EMBEDDING_DIM}); "
+                            "check the embedding model against the pgvector column width."
+                        )
+                    distance = sqlalchemy_text(
+                        f"binary_quantize(embedding)::bit({CHUNK_EMBEDDING_DIM}) <~> "
+                        f"binary_quantize(CAST(:query_vec AS vector))::bit({CHUNK_EMBEDDING_DIM})"
+                    ).bindparams(query_vec=str(list(query_embedding)))
+                else:
+                    distance = ChunkEmbedding.embedding.cosine_distance(query_embedding)
+                self._configure_ann_scan(db, candidate_limit, scan_limit)
+                stmt = stmt.order_by(distance).limit(scan_limit)
                 rows = db.execute(stmt).scalars().all()
                 chunks = []
                 for row in rows:
@@ -263,6 +549,26 @@ class PgVectorContractVectorStore:
                 n_results=n_results,
             )
 
+    def _configure_ann_scan(self, db, candidate_limit: int, scan_limit: Optional[int] = None) -> None:
+        """
+        Tune the HNSW index scan for this transaction.
+
+        ef_search must cover the rows fetched from the scan (metadata filters
+        are applied after the ANN scan); past PGVECTOR_EXACT_SEARCH_ABOVE final
+        candidates the index is bypassed for an exact scan. The binary
+        shortlist's rerank factor does not count toward that threshold.
+        """
+        if self.engine.dialect.name != "postgresql":
+            return
+        if candidate_limit > PGVECTOR_EXACT_SEARCH_ABOVE:
+            db.execute(sqlalchemy_text("SET LOCAL enable_indexscan = off"))
+            return
+        ef_search = min(
+            max(PGVECTOR_HNSW_EF_SEARCH, scan_limit or candidate_limit),
+            _PGVECTOR_MAX_EF_SEARCH,
+        )
+        db.execute(sqlalchemy_text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+
     def get_chunk(self, chunk_id: str) -> Optional[dict]:
         with self.session_factory() as db:
             row = db.get(ChunkEmbedding, chunk_id)
@@ -288,6 +594,15 @@ class ContractVectorStore:
     def __init__(self, persist_dir: Path = None, collection_name: str = None):
         settings = get_platform_settings()
         self._backend = None
+        self.search_cache = (
+            SemanticQueryCache(
+                threshold=VECTOR_SEARCH_SEMANTIC_CACHE_THRESHOLD,
+                maxsize=VECTOR_SEARCH_SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl=VECTOR_SEARCH_SEMANTIC_CACHE_TTL_SECONDS,
+            )
+            if VECTOR_SEARCH_SEMANTIC_CACHE_ENABLED
+            else None
+        )
         if settings.db_enabled:
             try:
                 self._backend = PgVectorContractVectorStore(settings.postgres_url)
@@ -298,10 +613,19 @@ class ContractVectorStore:
         self._backend = _ChromaContractVectorStore(persist_dir=persist_dir, collection_name=collection_name)
     
     def reset_collection(self):
+        self._clear_search_cache()
         return self._backend.reset_collection()
     
-    def add_chunks(self, chunks: list[dict], batch_size: int = 50) -> int:
+    def add_chunks(self, chunks: list[dict], batch_size: int = 50, normalized: bool = False) -> int:
+        """Index chunks; pass normalized=True for chunks from load_chunks_from_file."""
+        self._clear_search_cache()
+        if not normalized:
+            chunks = [_normalize_chunk(chunk) for chunk in chunks]
         return self._backend.add_chunks(chunks, batch_size=batch_size)
+
+    def _clear_search_cache(self) -> None:
+        if self.search_cache is not None:
+            self.search_cache.clear()
     
     def search(
         self,
@@ -314,23 +638,66 @@ class ContractVectorStore:
         urgency_tier: str = None,
         doc_type: str = None,
         boost_articles: list = None,
+        query_embedding: list = None,
     ) -> list[dict]:
-        return self._backend.search(
+        filters = {
+            "contract_id": contract_id,
+            "region_id": region_id,
+            "classification": classification,
+            "topic": topic,
+            "urgency_tier": urgency_tier,
+            "doc_type": doc_type,
+            "boost_articles": boost_articles,
+        }
+        if self.search_cache is None:
+            return self._backend.search(
+                query=query,
+                n_results=n_results,
+                query_embedding=query_embedding,
+                **filters,
+            )
+
+        # Near-duplicate queries with identical filters reuse the result list
+        # and skip the ANN query.
+        if query_embedding is None:
+            query_embedding = self.embed_queries([query])[0]
+        scope = _search_cache_scope(query, n_results or TOP_K_RESULTS, filters)
+        cached = self.search_cache.get(query_embedding, scope)
+        if cached is not None:
+            return cached
+        chunks = self._backend.search(
             query=query,
             n_results=n_results,
-            contract_id=contract_id,
-            region_id=region_id,
-            classification=classification,
-            topic=topic,
-            urgency_tier=urgency_tier,
-            doc_type=doc_type,
-            boost_articles=boost_articles,
+            query_embedding=query_embedding,
+            **filters,
         )
+        self.search_cache.put(query_embedding, scope, chunks)
+        return chunks
+
+    def embed_queries(self, queries: list[str]) -> list[list]:
+        """Encode several queries in one embedding-model forward pass."""
+        return self._backend.embed_queries(queries)
+
+    def search_batch(self, queries: list[str], n_results: int = None, **filters) -> list[list[dict]]:
+        """
+        Run several searches that share the same filters.
+
+        All queries are embedded in a single batch; results are returned in
+        the same order as `queries`.
+        """
+        if not queries:
+            return []
+        embeddings = self.embed_queries(queries)
+        return [
+            self.search(query=query, n_results=n_results, query_embedding=embedding, **filters)
+            for query, embedding in zip(queries, embeddings)
+        ]
 
     def get_chunk(self, chunk_id: str) -> Optional[dict]:
         return self._backend.get_chunk(chunk_id)
 
     def clear(self):
+        self._clear_search_cache()
         return self._backend.clear()
 
     def count(self) -> int:
@@ -354,13 +721,14 @@ class _ChromaContractVectorStore:
         self.client = chromadb.PersistentClient(path=str(self.persist_dir))
         
         # Initialize embedding model
-        print(f"Loading embedding model: {EMBEDDING_MODEL}")
-        self.embedder = SentenceTransformer(EMBEDDING_MODEL)
+        self.embedder = _load_embedder()
+        self.embedding_cache = EmbeddingCache()
+        self.document_embedding_cache = _open_document_embedding_cache()
         
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"hnsw:space": "cosine"}
+            metadata=dict(CHROMA_HNSW_METADATA)
         )
         
         print(f"Vector store initialized. Collection '{self.collection_name}' has {self.collection.count()} documents.")
@@ -370,7 +738,7 @@ class _ChromaContractVectorStore:
         self.client.delete_collection(self.collection_name)
         self.collection = self.client.create_collection(
             name=self.collection_name,
-            metadata={"hnsw:space": "cosine"}
+            metadata=dict(CHROMA_HNSW_METADATA)
         )
         print(f"Collection '{self.collection_name}' reset. Now has {self.collection.count()} documents.")
     
@@ -388,100 +756,83 @@ class _ChromaContractVectorStore:
         if not chunks:
             return 0
         
-        # Deduplicate chunks by ID (keep first occurrence)
+        # Deduplicate chunks by ID: the first occurrence keeps its ID, later
+        # ones get the next free "_<n>" suffix.
         seen_ids = set()
-        unique_chunks = []
+        suffix_counts = {}
         for chunk in chunks:
             chunk_id = chunk['chunk_id']
-            if chunk_id not in seen_ids:
-                seen_ids.add(chunk_id)
-                unique_chunks.append(chunk)
-            else:
-                # Make ID unique by appending index
-                new_id = f"{chunk_id}_{len([c for c in unique_chunks if c['chunk_id'].startswith(chunk_id)])}"
+            if chunk_id in seen_ids:
+                n = suffix_counts.get(chunk_id, 0)
+                new_id = chunk_id
+                while new_id in seen_ids:
+                    n += 1
+                    new_id = f"{chunk_id}_{n}"
+                suffix_counts[chunk_id] = n
                 chunk['chunk_id'] = new_id
-                unique_chunks.append(chunk)
+            seen_ids.add(chunk['chunk_id'])
         
-        chunks = unique_chunks
         print(f"Processing {len(chunks)} unique chunks...")
         
+        # Each batch is upserted on a worker thread while the next batch is
+        # encoded, so Chroma's write I/O overlaps the CPU-bound encoder. At
+        # most one upsert is in flight, which keeps batches in order.
         added = 0
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i:i + batch_size]
-            
-            ids = []
-            documents = []
-            metadatas = []
-            embeddings = []
-            
-            for chunk in batch:
-                chunk_id = chunk['chunk_id']
-                embed_text = chunk['content']  # Clean text for embedding (no HTML, no pipe-tables)
-                display_text = chunk.get('content_with_tables', chunk['content'])  # Rich text for LLM
-
-                # Create embedding from clean text
-                embedding = self.embedder.encode(embed_text).tolist()
-
-                # Prepare metadata (ChromaDB only supports str, int, float, bool)
-                # Handle both old format (topic_tags) and new format (topics)
-                topics = chunk.get('topics', chunk.get('topic_tags', []))
-                if isinstance(topics, str):
-                    topics = topics.split(',') if topics else []
-                
-                applies_to = chunk.get('applies_to', ['all'])
-                if isinstance(applies_to, str):
-                    applies_to = applies_to.split(',') if applies_to else ['all']
-                
-                # Phase 4: Handle concept-indexed fields
-                worker_questions = chunk.get('worker_questions', [])
-                if isinstance(worker_questions, str):
-                    worker_questions = [worker_questions] if worker_questions else []
-
-                alternative_names = chunk.get('alternative_names', [])
-                if isinstance(alternative_names, str):
-                    alternative_names = [alternative_names] if alternative_names else []
-
-                metadata = {
-                    'contract_id': chunk.get('contract_id', ''),
-                    'region_id': chunk.get('region_id', ''),
-                    'article_num': chunk.get('article_num') or 0,
-                    'article_title': chunk.get('article_title', ''),
-                    'section_num': chunk.get('section_num') or 0,
-                    'subsection': chunk.get('subsection') or '',
-                    'citation': chunk.get('citation', ''),
-                    'parent_context': chunk.get('parent_context', ''),
-                    'doc_type': chunk.get('doc_type', 'cba'),
-                    # Enriched metadata
-                    'applies_to': ','.join(applies_to),
-                    'topics': ','.join(topics),
-                    'summary': chunk.get('summary') or '',
-                    'is_definition': chunk.get('is_definition', False),
-                    'is_exception': chunk.get('is_exception', False),
-                    'hire_date_sensitive': chunk.get('hire_date_sensitive', False),
-                    'is_high_stakes': chunk.get('is_high_stakes', False),
-                    # Phase 4: Concept-indexed fields for vocabulary bridging
-                    'worker_questions': '|'.join(worker_questions),
-                    'alternative_names': '|'.join(alternative_names),
-                }
-                
-                ids.append(chunk_id)
-                documents.append(display_text)  # Store rich text (with pipe-tables) for LLM
-                metadatas.append(metadata)
-                embeddings.append(embedding)
-            
-            # Upsert to collection
-            self.collection.upsert(
-                ids=ids,
-                documents=documents,
-                metadatas=metadatas,
-                embeddings=embeddings
-            )
-            
-            added += len(batch)
-            print(f"  Added {added}/{len(chunks)} chunks...")
+        pending = None  # (future, batch length) of the upsert in flight
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="karl-chroma-upsert") as upsert_pool:
+            for i in range(0, len(chunks), batch_size):
+                batch = chunks[i:i + batch_size]
+                ids, documents, metadatas, embeddings = self._prepare_upsert_batch(batch)
+                if pending is not None:
+                    pending[0].result()
+                    added += pending[1]
+                    print(f"  Added {added}/{len(chunks)} chunks...")
+                future = upsert_pool.submit(
+                    self.collection.upsert,
+                    ids=ids,
+                    documents=documents,
+                    metadatas=metadatas,
+                    embeddings=embeddings,
+                )
+                pending = (future, len(batch))
+            if pending is not None:
+                pending[0].result()
+                added += pending[1]
+                print(f"  Added {added}/{len(chunks)} chunks...")
         
         return added
+
+    def _prepare_upsert_batch(self, batch: list[dict]) -> tuple[list, list, list, list]:
+        """Encode one batch and build its Chroma ids, documents, metadatas and embeddings."""
+        # Embed the clean text (no HTML, no pipe-tables) in batched forward
+        # passes; chunks unchanged since the last build come from the
+        # on-disk embedding cache.
+        embeddings = _encode_documents(
+            self.embedder,
+            [chunk['content'] for chunk in batch],
+            cache=self.document_embedding_cache,
+            as_lists=False,  # one float32 (batch, dim) array for Chroma
+        )
+
+        ids = []
+        documents = []
+        metadatas = []
+        for chunk in batch:
+            chunk_id = chunk['chunk_id']
+            display_text = chunk.get('content_with_tables', chunk['content'])  # Rich text for LLM
+
+            metadata = _chunk_metadata(chunk)
+
+            ids.append(chunk_id)
+            documents.append(display_text)  # Store rich text (with pipe-tables) for LLM
+            metadatas.append(metadata)
+
+        return ids, documents, metadatas, embeddings
     
+    def embed_queries(self, queries: list[str]) -> list[list]:
+        """Encode several queries in one embedding-model forward pass."""
+        return _encode_queries(self.embedder, self.embedding_cache, list(queries))
+
     def search(
         self,
         query: str,
@@ -493,6 +844,7 @@ class _ChromaContractVectorStore:
         urgency_tier: str = None,
         doc_type: str = None,
         boost_articles: list = None,
+        query_embedding: list = None,
     ) -> list[dict]:
         """
         Search for relevant chunks.
@@ -505,18 +857,19 @@ class _ChromaContractVectorStore:
             topic: Filter by topic tag
             urgency_tier: Filter by urgency (standard/high_stakes)
             doc_type: Filter by document type (cba/lou/appendix)
+            query_embedding: Precomputed embedding for `query` (skips encoding)
         
         Returns:
             List of matching chunks with scores
         """
-        import re
-        
         if n_results is None:
             n_results = TOP_K_RESULTS
         
         # Check for explicit article/section references in query
-        article_refs = re.findall(r'article\s*(\d+)', query.lower())
-        section_refs = re.findall(r'section\s*(\d+)', query.lower())
+        query_lower = query.lower()
+        article_refs = set(_ARTICLE_REF_RE.findall(query_lower))
+        section_refs = set(_SECTION_REF_RE.findall(query_lower))
+        boost_article_set = set(boost_articles) if boost_articles else None
         
         # Build where clause
         where = None
@@ -538,8 +891,9 @@ class _ChromaContractVectorStore:
             else:
                 where = {"$and": where_clauses}
         
-        # Create query embedding
-        query_embedding = self.embedder.encode(query).tolist()
+        # Create query embedding (unless the caller batch-encoded it already)
+        if query_embedding is None:
+            query_embedding = self.embed_queries([query])[0]
         
         # Request more results initially to allow for boosting
         search_n = max(n_results * 2, 15) if article_refs else n_results
@@ -552,23 +906,27 @@ class _ChromaContractVectorStore:
             include=["documents", "metadatas", "distances"]
         )
         
-        # Format results
+        # Format results (unpack Chroma's nested per-query lists once)
         chunks = []
         if results['ids'] and results['ids'][0]:
-            for i, chunk_id in enumerate(results['ids'][0]):
-                distance = results['distances'][0][i] if results['distances'] else 0
+            result_ids = results['ids'][0]
+            distances = results['distances'][0] if results['distances'] else None
+            documents = results['documents'][0] if results['documents'] else None
+            metadatas = results['metadatas'][0]
+            for i, chunk_id in enumerate(result_ids):
+                distance = distances[i] if distances is not None else 0
                 similarity = 1 - distance  # Convert distance to similarity
                 
                 if similarity < SIMILARITY_THRESHOLD:
                     continue
                 
-                document_text = results['documents'][0][i] if results['documents'] else ''
+                document_text = documents[i] if documents is not None else ''
                 chunk = {
                     'chunk_id': chunk_id,
                     'content': document_text,
                     'content_with_tables': document_text,  # Consistent with JSON-loaded chunks
                     'similarity': similarity,
-                    **results['metadatas'][0][i]
+                    **metadatas[i]
                 }
 
                 # Defense-in-depth tenancy guard.
@@ -580,25 +938,15 @@ class _ChromaContractVectorStore:
                         continue
                 
                 # Boost score if chunk matches explicit article reference in query
-                if article_refs:
-                    chunk_article = str(chunk.get('article_num', 0))
-                    for ref in article_refs:
-                        if chunk_article == ref:
-                            chunk['similarity'] += 0.3  # Significant boost for exact match
-                            break
+                if article_refs and str(chunk.get('article_num', 0)) in article_refs:
+                    chunk['similarity'] += 0.3  # Significant boost for exact match
                 
-                if section_refs:
-                    chunk_section = str(chunk.get('section_num', 0))
-                    for ref in section_refs:
-                        if chunk_section == ref:
-                            chunk['similarity'] += 0.1  # Smaller boost for section match
-                            break
+                if section_refs and str(chunk.get('section_num', 0)) in section_refs:
+                    chunk['similarity'] += 0.1  # Smaller boost for section match
                 
                 # Boost score if chunk matches topic-relevant articles
-                if boost_articles:
-                    chunk_article_num = chunk.get('article_num', 0)
-                    if chunk_article_num in boost_articles:
-                        chunk['similarity'] += 0.2  # Moderate boost for topic relevance
+                if boost_article_set and chunk.get('article_num', 0) in boost_article_set:
+                    chunk['similarity'] += 0.2  # Moderate boost for topic relevance
                 
                 # Boost if classification matches (but don't filter)
                 if classification:
@@ -627,7 +975,7 @@ class _ChromaContractVectorStore:
                 chunks.append(chunk)
         
         # Re-sort by boosted similarity and limit to n_results
-        chunks.sort(key=lambda x: x['similarity'], reverse=True)
+        chunks.sort(key=_SIMILARITY_KEY, reverse=True)
         return chunks[:n_results]
     
     def get_chunk(self, chunk_id: str) -> Optional[dict]:
@@ -650,7 +998,7 @@ class _ChromaContractVectorStore:
         self.client.delete_collection(self.collection_name)
         self.collection = self.client.create_collection(
             name=self.collection_name,
-            metadata={"hnsw:space": "cosine"}
+            metadata=dict(CHROMA_HNSW_METADATA)
         )
         print(f"Cleared collection '{self.collection_name}'")
     
@@ -660,13 +1008,13 @@ class _ChromaContractVectorStore:
 
 
 def load_chunks_from_file(chunks_file: Path = None, contract_id: str = CONTRACT_ID) -> list[dict]:
-    """Load chunks from JSON file."""
+    """Load chunks from JSON file, normalized for add_chunks."""
     if chunks_file is None:
         chunks_file = resolve_chunk_file(contract_id=contract_id, allow_shared_fallback=True)
     if chunks_file is None:
         raise FileNotFoundError("No chunk artifact found for vector index build")
-    with open(chunks_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # Fresh parse (not the shared artifact cache): add_chunks renames duplicate IDs in place.
+    return [_normalize_chunk(chunk) for chunk in parse_json_file(chunks_file)]
 
 
 def build_index(clear_existing: bool = False, contract_id: str = CONTRACT_ID) -> ContractVectorStore:
@@ -691,7 +1039,7 @@ def build_index(clear_existing: bool = False, contract_id: str = CONTRACT_ID) ->
     print(f"Loaded {len(chunks)} chunks from {chunks_file}")
     
     # Add to index
-    added = store.add_chunks(chunks)
+    added = store.add_chunks(chunks, normalized=True)
     print(f"Indexed {added} chunks successfully.")
     
     return store
@@ -0,0 +1,115 @@
+"""Deterministic tests for the on-disk chunk embedding cache."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.retrieval.embedding_cache import PersistentEmbeddingCache
+from backend.retrieval.vector_store import _encode_documents
+
+
+class _Vector(list):
+    def tolist(self) -> list:
+        return list(self)
+
+
+class _CountingEncoder:
+    """Deterministic encoder that records which texts it was asked to encode."""
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode(self, texts: list[str], batch_size: int = 32) -> list[_Vector]:
+        self.encoded.extend(texts)
+        # Round through float32 like a real encoder's output.
+        return [_Vector(array("f", [len(text) / 3.0, 0.1]).tolist()) for text in texts]
+
+
+def test_roundtrip_is_exact_and_model_scoped() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "embed_cache.sqlite"
+        cache = PersistentEmbeddingCache(path, model_name="model-a")
+        vector = array("f", [0.1, -2.5, 3.333]).tolist()
+        cache.put_many(["Section 42 vacation"], [vector])
+
+        assert cache.get_many(["Section 42 vacation", "unseen"]) == [vector, None]
+        # Reopening reads the same file; another model never sees the entry.
+        assert PersistentEmbeddingCache(path, model_name="model-a").get_many(["Section 42 vacation"]) == [vector]
+        assert PersistentEmbeddingCache(path, model_name="model-b").get_many(["Section 42 vacation"]) == [None]
+
+
+def test_rebuild_encodes_only_changed_chunks() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PersistentEmbeddingCache(Path(tmp) / "embed_cache.sqlite", model_name="model-a")
+        first = _CountingEncoder()
+        texts = ["Article 9 wages", "Article 12 overtime", "Article 17 vacation"]
+        cold = _encode_documents(first, texts, cache=cache)
+        assert first.encoded == texts
+
+        second = _CountingEncoder()
+        edited = ["Article 9 wages", "Article 12 overtime (amended)", "Article 17 vacation"]
+        warm = _encode_documents(second, edited, cache=cache)
+        assert second.encoded == ["Article 12 overtime (amended)"]
+        assert warm[0] == cold[0] and warm[2] == cold[2]
+        assert cache.count() == 4
+
+
+def test_array_batch_mixes_cached_and_fresh_rows_uniformly() -> None:
+    try:
+        import numpy as np  # ships with sentence-transformers
+    except ImportError:
+        return
+
+    class _ArrayEncoder(_CountingEncoder):
+        def encode(self, texts: list[str], batch_size: int = 32):
+            self.encoded.extend(texts)
+            return np.asarray([[len(text) / 3.0, 0.1] for text in texts], dtype=np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PersistentEmbeddingCache(Path(tmp) / "embed_cache.sqlite", model_name="model-a")
+        _encode_documents(_ArrayEncoder(), ["Article 9 wages", "Article 17 vacation"], cache=cache)
+
+        encoder = _ArrayEncoder()
+        texts = ["Article 9 wages", "Article 12 overtime", "Article 17 vacation"]
+        batch = _encode_documents(encoder, texts, cache=cache, as_lists=False)
+        assert encoder.encoded == ["Article 12 overtime"]
+        # Cache hits (stored as lists) and fresh encoder rows come back as one array.
+        assert isinstance(batch, np.ndarray)
+        assert batch.dtype == np.float32 and batch.shape == (3, 2)
+        assert len({type(row) for row in batch}) == 1
+        expected = np.asarray([[len(text) / 3.0, 0.1] for text in texts], dtype=np.float32)
+        assert np.array_equal(batch, expected)
+        assert cache.get_many(["Article 12 overtime"])[0] == expected[1].tolist()
+
+
+def test_prunes_least_recently_used_rows_above_cap() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PersistentEmbeddingCache(Path(tmp) / "embed_cache.sqlite", model_name="model-a", max_rows=2)
+        cache.put_many(["Article 9 wages"], [[1.0]])
+        cache.put_many(["Article 12 overtime"], [[2.0]])
+        assert cache.get_many(["Article 9 wages"]) == [[1.0]]  # overtime is now least recent
+        cache.put_many(["Article 17 vacation"], [[3.0]])
+
+        assert cache.count() == 2
+        assert cache.get_many(["Article 9 wages", "Article 12 overtime", "Article 17 vacation"]) == [
+            [1.0],
+            None,
+            [3.0],
+        ]
+
+
+def main() -> None:
+    test_roundtrip_is_exact_and_model_scoped()
+    test_rebuild_encodes_only_changed_chunks()
+    test_array_batch_mixes_cached_and_fresh_rows_uniformly()
+    test_prunes_least_recently_used_rows_above_cap()
+    print("[OK] Embedding cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
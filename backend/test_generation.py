@@ -13,6 +13,7 @@ Requires: GEMINI_API_KEY environment variable
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -126,7 +127,9 @@ def run_generation_test():
     print("\n[3] Running Generation Tests...")
     print("-" * 70)
     
-    results = []
+    # Classify, retrieve and build prompts serially (keeps the log readable),
+    # then generate all answers concurrently: the LLM round trips dominate.
+    prepared = []
     
     for i, tc in enumerate(test_questions, 1):
         question = tc["question"]
@@ -164,10 +167,28 @@ def run_generation_test():
             requires_escalation=requires_esc or intent.requires_escalation,
             query_expansions=query_expansions
         )
-        
-        # Generate response
-        print("\nGenerating response...")
-        answer = generate_response(genai, question, system_prompt)
+        prepared.append({
+            "question": question,
+            "chunks": chunks,
+            "wage_info": wage_info,
+            "requires_escalation": requires_esc or intent.requires_escalation,
+            "system_prompt": system_prompt,
+        })
+    
+    # Generate responses
+    print(f"\nGenerating {len(prepared)} responses concurrently...")
+    with ThreadPoolExecutor(max_workers=max(1, len(prepared))) as pool:
+        answers = list(pool.map(
+            lambda p: generate_response(genai, p["question"], p["system_prompt"]),
+            prepared,
+        ))
+    
+    results = []
+    
+    for i, (p, answer) in enumerate(zip(prepared, answers), 1):
+        chunks = p["chunks"]
+        print(f"\n--- Test {i} ---")
+        print(f"Q: {p['question']}")
         
         if answer.startswith("ERROR:"):
             print(f"  {answer}")
@@ -178,11 +199,11 @@ def run_generation_test():
         verification = verify_response(
             answer,
             chunks,
-            requires_escalation=requires_esc or intent.requires_escalation
+            requires_escalation=p["requires_escalation"]
         )
         
         # Format result
-        formatted = format_response_with_sources(answer, chunks, wage_info)
+        formatted = format_response_with_sources(answer, chunks, p["wage_info"])
         
         print(f"\n--- Generated Answer ---")
         print(answer[:500] + ("..." if len(answer) > 500 else ""))
@@ -0,0 +1,56 @@
+"""Deterministic tests for pgvector ANN scan tuning (no database needed)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.retrieval import vector_store
+from backend.retrieval.vector_store import PgVectorContractVectorStore, _ann_candidate_limits
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def execute(self, statement) -> None:
+        self.statements.append(str(statement))
+
+
+def _scan_statements(n_results: int) -> tuple[tuple[int, int], list[str]]:
+    store = PgVectorContractVectorStore.__new__(PgVectorContractVectorStore)
+    store.engine = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+    db = _RecordingSession()
+    limits = _ann_candidate_limits(n_results)
+    with patch.object(vector_store, "sqlalchemy_text", lambda sql: sql):
+        store._configure_ann_scan(db, *limits)
+    return limits, db.statements
+
+
+def test_binary_shortlist_keeps_the_index_scan() -> None:
+    # HybridSearcher asks for n_results * 2 = 10 vector results.
+    with patch.object(vector_store, "PGVECTOR_BINARY_QUANTIZATION", True), \
+            patch.object(vector_store, "PGVECTOR_BINARY_RERANK_FACTOR", 4):
+        limits, statements = _scan_statements(10)
+    assert limits == (30, 120)
+    assert statements == ["SET LOCAL hnsw.ef_search = 120"], statements
+
+
+def test_large_candidate_sets_bypass_the_index() -> None:
+    with patch.object(vector_store, "PGVECTOR_BINARY_QUANTIZATION", False):
+        assert _scan_statements(10)[1] == ["SET LOCAL hnsw.ef_search = 100"]
+        assert _scan_statements(40)[1] == ["SET LOCAL enable_indexscan = off"]
+
+
+def main() -> None:
+    test_binary_shortlist_keeps_the_index_scan()
+    test_large_candidate_sets_bypass_the_index()
+    print("[OK] pgvector scan tuning tests passed")
+
+
+if __name__ == "__main__":
+    main()
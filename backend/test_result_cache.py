@@ -0,0 +1,54 @@
+"""Deterministic tests for the exact retrieval result cache."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.retrieval.result_cache import RetrievalResultCache
+
+
+def test_repeat_hits_with_private_copies() -> None:
+    cache = RetrievalResultCache(maxsize=4, ttl=60)
+    key = ("when do I get overtime?", ("contract_a", "overtime"))
+    cache.put(key, {"chunks": [{"chunk_id": "art9_sec20"}]})
+
+    hit = cache.get(key)
+    assert hit == {"chunks": [{"chunk_id": "art9_sec20"}]}
+
+    # Returned results are private copies.
+    hit["chunks"].append({"chunk_id": "mutated"})
+    assert len(cache.get(key)["chunks"]) == 1
+    assert cache.get(("when do I get overtime?", ("contract_b", "overtime"))) is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+
+
+def test_expired_and_least_recent_entries_miss() -> None:
+    expired = RetrievalResultCache(maxsize=4, ttl=-1)
+    expired.put("q", {"chunks": []})
+    assert expired.get("q") is None
+    assert expired.stats()["entries"] == 0
+
+    bounded = RetrievalResultCache(maxsize=2, ttl=60)
+    bounded.put("first", {"chunks": []})
+    bounded.put("second", {"chunks": []})
+    assert bounded.get("first") == {"chunks": []}  # "second" is now least recent
+    bounded.put("third", {"chunks": []})
+    assert bounded.get("second") is None
+    assert bounded.get("first") == {"chunks": []}
+    assert bounded.stats()["evictions"] == 1
+
+
+def main() -> None:
+    test_repeat_hits_with_private_copies()
+    test_expired_and_least_recent_entries_miss()
+    print("[OK] Result cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
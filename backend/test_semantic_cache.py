@@ -0,0 +1,110 @@
+"""Deterministic tests for the semantic retrieval cache."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.retrieval.semantic_cache import SemanticQueryCache
+from backend.retrieval.vector_store import ContractVectorStore
+
+
+def test_near_duplicate_hits_within_scope() -> None:
+    cache = SemanticQueryCache(threshold=0.95, maxsize=4, ttl=60)
+    cache.put([1.0, 0.0], ("contract_a", "overtime"), {"chunks": [{"chunk_id": "art9_sec20"}]})
+
+    hit = cache.get([0.99, 0.05], ("contract_a", "overtime"))
+    assert hit == {"chunks": [{"chunk_id": "art9_sec20"}]}
+
+    # Returned results are private copies.
+    hit["chunks"].append({"chunk_id": "mutated"})
+    assert len(cache.get([1.0, 0.0], ("contract_a", "overtime"))["chunks"]) == 1
+
+
+def test_miss_on_other_scope_or_distant_query() -> None:
+    cache = SemanticQueryCache(threshold=0.95, maxsize=4, ttl=60)
+    cache.put([1.0, 0.0], ("contract_a", "overtime"), {"chunks": []})
+
+    assert cache.get([1.0, 0.0], ("contract_b", "overtime")) is None
+    assert cache.get([0.5, 0.5], ("contract_a", "overtime")) is None
+
+
+def test_expired_and_evicted_entries_miss() -> None:
+    expired = SemanticQueryCache(threshold=0.95, maxsize=4, ttl=-1)
+    expired.put([1.0, 0.0], "scope", {"chunks": []})
+    assert expired.get([1.0, 0.0], "scope") is None
+
+    bounded = SemanticQueryCache(threshold=0.95, maxsize=1, ttl=60)
+    bounded.put([1.0, 0.0], "first", {"chunks": []})
+    bounded.put([1.0, 0.0], "second", {"chunks": []})
+    assert bounded.get([1.0, 0.0], "first") is None
+    assert bounded.get([1.0, 0.0], "second") == {"chunks": []}
+
+
+def test_closest_entry_wins_and_eviction_is_global() -> None:
+    cache = SemanticQueryCache(threshold=0.9, maxsize=3, ttl=60)
+    cache.put([1.0, 0.0, 0.0], "overtime", {"chunk_id": "art9_sec20"})
+    cache.put([0.95, 0.3, 0.0], "overtime", {"chunk_id": "art9_sec21"})
+    cache.put([0.0, 0.0, 1.0], "seniority", {"chunk_id": "art14_sec1"})
+
+    assert cache.get([0.96, 0.28, 0.0], "overtime") == {"chunk_id": "art9_sec21"}
+
+    # The fourth entry evicts the oldest one, whatever its scope.
+    cache.put([0.0, 1.0, 0.0], "seniority", {"chunk_id": "art14_sec2"})
+    assert cache.get([1.0, 0.0, 0.0], "overtime") == {"chunk_id": "art9_sec21"}
+    assert cache.get([0.0, 0.0, 1.0], "seniority") == {"chunk_id": "art14_sec1"}
+    assert cache.get([0.0, 1.0, 0.0], "seniority") == {"chunk_id": "art14_sec2"}
+
+
+class _RecordingBackend:
+    """Vector-store backend double that embeds by keyword and records searches."""
+
+    def __init__(self) -> None:
+        self.searches: list[str] = []
+
+    def embed_queries(self, queries: list[str]) -> list[list]:
+        return [[1.0, 0.01 * len(q)] if "overtime" in q else [0.0, 1.0] for q in queries]
+
+    def search(self, query: str, **kwargs) -> list[dict]:
+        self.searches.append(query)
+        return [{"chunk_id": "art12_sec30", "similarity": 0.8}]
+
+    def add_chunks(self, chunks: list[dict], batch_size: int = 50) -> int:
+        return len(chunks)
+
+
+def test_vector_search_cache_skips_near_duplicate_searches() -> None:
+    store = ContractVectorStore.__new__(ContractVectorStore)
+    store._backend = _RecordingBackend()
+    store.search_cache = SemanticQueryCache(threshold=0.97, maxsize=8, ttl=60)
+
+    first = store.search("overtime rules", contract_id="contract_a")
+    assert store.search("overtime rules?", contract_id="contract_a") == first
+    assert store._backend.searches == ["overtime rules"]
+
+    # Other filters, explicit article refs and index changes all miss.
+    store.search("overtime rules", contract_id="contract_b")
+    store.search("overtime article 12", contract_id="contract_a")
+    store.add_chunks([])
+    store.search("overtime rules", contract_id="contract_a")
+    assert store._backend.searches == [
+        "overtime rules",
+        "overtime rules",
+        "overtime article 12",
+        "overtime rules",
+    ]
+
+
+def main() -> None:
+    test_near_duplicate_hits_within_scope()
+    test_miss_on_other_scope_or_distant_query()
+    test_expired_and_evicted_entries_miss()
+    test_closest_entry_wins_and_eviction_is_global()
+    test_vector_search_cache_skips_near_duplicate_searches()
+    print("[OK] Semantic cache tests passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,11 @@ These checks run BM25-only to avoid embedding-model/network dependencies.
 """
 
 from pathlib import Path
+import json
 import sys
+import tempfile
+import threading
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -14,6 +18,8 @@ from backend.retrieval.router import (
     HybridRetriever,
     build_followup_routing_plan,
     classify_intent,
+    clear_query_routing_caches,
+    expand_query,
     extract_classifications_for_contract,
     infer_side_letter_articles,
 )
@@ -459,6 +465,69 @@ def _test_explicit_side_letter_query_infers_doc_type_without_pack_backfill() ->
     )
 
 
+def _test_preload_builds_contract_bm25_index() -> None:
+    contract_id = "local7_safeway_pueblo_clerks_2022"
+    retriever = HybridRetriever(vector_store=None)
+    retriever.preload(contract_id)
+
+    bm25_keys = list(retriever.hybrid_searcher._bm25_by_contract)
+    assert any(key.startswith(f"{contract_id}::") for key in bm25_keys), (
+        f"Expected preload to build the contract BM25 index, got: {bm25_keys}"
+    )
+    assert retriever._all_chunks_by_contract.get(contract_id), (
+        "Expected preload to load contract chunks"
+    )
+
+    _, citations = _run_bm25_retrieval(query="float days", contract_id=contract_id, n_results=8)
+    assert any(c.startswith("Article 16") for c in citations), (
+        f"Expected preloaded retrieval to match cold retrieval for 'float days'. Got: {citations}"
+    )
+
+
+def _test_warm_up_thread_starts_once_per_contract() -> None:
+    started = []
+
+    class _RecordingThread(threading.Thread):
+        def start(self) -> None:
+            started.append(self.name)
+
+    with patch.object(HybridRetriever, "_WARM_UP_STARTED", set()), \
+            patch.object(router_module.threading, "Thread", _RecordingThread):
+        for _ in range(3):
+            HybridRetriever(vector_store=None)
+    assert started == ["karl-retriever-warmup"], started
+
+
+def _test_clear_routing_caches_picks_up_manifest_reload() -> None:
+    contract_id = "routing_cache_reload_test"
+    original_manifests_dir = router_module.MANIFESTS_DIR
+
+    def _write_manifest(contract_term: str) -> None:
+        manifest = {"query_routing": {"slang_to_contract": {"zorbix": contract_term}}}
+        (Path(tmp) / f"{contract_id}.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            router_module.MANIFESTS_DIR = Path(tmp)
+            clear_query_routing_caches()
+            _write_manifest("overtime pay")
+            expanded, _ = expand_query("zorbix rules", contract_id=contract_id)
+            assert "overtime pay" in expanded, expanded
+
+            # Edited manifest: memoized tables still serve the old alias...
+            _write_manifest("vacation schedule")
+            expanded, _ = expand_query("zorbix rules", contract_id=contract_id)
+            assert "overtime pay" in expanded, expanded
+
+            # ...until the routing caches are cleared.
+            clear_query_routing_caches()
+            expanded, _ = expand_query("zorbix rules", contract_id=contract_id)
+            assert "vacation schedule" in expanded and "overtime pay" not in expanded, expanded
+        finally:
+            router_module.MANIFESTS_DIR = original_manifests_dir
+            clear_query_routing_caches()
+
+
 def main() -> None:
     original_vector = router_module.HYBRID_VECTOR_WEIGHT
     original_keyword = router_module.HYBRID_KEYWORD_WEIGHT
@@ -484,6 +553,9 @@ def main() -> None:
         _test_side_letter_followup_query_routes_side_letter_anchor()
         _test_followup_routing_plan_rewrites_short_vacation_turn()
         _test_explicit_side_letter_query_infers_doc_type_without_pack_backfill()
+        _test_preload_builds_contract_bm25_index()
+        _test_clear_routing_caches_picks_up_manifest_reload()
+        _test_warm_up_thread_starts_once_per_contract()
     finally:
         router_module.HYBRID_VECTOR_WEIGHT = original_vector
         router_module.HYBRID_KEYWORD_WEIGHT = original_keyword
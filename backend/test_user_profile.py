@@ -0,0 +1,118 @@
+"""Deterministic tests for in-memory session profiles."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.user import profile as profile_module
+from backend.user.profile import (
+    EmploymentType,
+    UserProfile,
+    clear_user_profile,
+    estimate_hours_worked,
+    get_user_profile,
+    update_user_profile,
+)
+
+
+def test_session_store_evicts_least_recent_profile() -> None:
+    single_shard = [(threading.RLock(), OrderedDict())]
+    with patch.object(profile_module, "USER_PROFILE_MAX_SESSIONS", 2), \
+            patch.object(profile_module, "_session_shards", single_shard):
+        profiles = single_shard[0][1]
+        first = update_user_profile("first", {"employment_type": "full_time"})
+        get_user_profile("second")
+        assert get_user_profile("first") is first  # "second" is now least recent
+        get_user_profile("third")
+
+        assert list(profiles) == ["first", "third"]
+        assert get_user_profile("first").employment_type.value == "full_time"
+        assert get_user_profile("second").employment_type.value == "unknown"
+
+        clear_user_profile("first")
+        clear_user_profile("missing")
+        assert "first" not in profiles
+
+
+def test_concurrent_first_access_shares_one_profile() -> None:
+    session_id = "test-concurrent-first-access"
+    clear_user_profile(session_id)
+    start = threading.Barrier(8)
+    seen = []
+
+    def _worker() -> None:
+        start.wait()
+        seen.append(get_user_profile(session_id))
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(profile) for profile in seen}) == 1
+    clear_user_profile(session_id)
+
+
+def test_updates_apply_contract_before_explicit_employer() -> None:
+    session_id = "test-update-order"
+    clear_user_profile(session_id)
+    # The explicit employer wins over the contract's default whatever the key order.
+    profile = update_user_profile(
+        session_id,
+        {"employer": "Test Employer", "hire_date": "2020-01-05", "contract_id": "safeway_pueblo_clerks_2022"},
+    )
+    assert profile.contract_id == "safeway_pueblo_clerks_2022"
+    assert profile.union_local == "UFCW Local 7"
+    assert profile.employer == "Test Employer"
+    assert profile.hire_date.isoformat() == "2020-01-05"
+    update_user_profile(session_id, {"employment_type": "not_a_type", "unknown_field": 1})
+    assert profile.employment_type.value == "unknown"
+    # Malformed client JSON falls back instead of raising.
+    update_user_profile(session_id, {"employment_type": ["full_time"]})
+    update_user_profile(session_id, {"employment_type": {"value": "full_time"}})
+    assert profile.employment_type.value == "unknown"
+    assert UserProfile.from_dict({"employment_type": ["x"]}).employment_type == EmploymentType.UNKNOWN
+    assert UserProfile.from_dict({"employment_type": "part_time"}).employment_type == EmploymentType.PART_TIME
+    clear_user_profile(session_id)
+
+
+def test_hours_estimate_is_reused_until_inputs_change() -> None:
+    profile = UserProfile(employment_type=EmploymentType.FULL_TIME, hire_date=date(2020, 1, 5))
+    first = estimate_hours_worked(profile)
+    assert estimate_hours_worked(profile) is first
+    try:
+        first.estimated_hours = 0  # shared between calls, so immutable
+    except FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("HoursEstimate should be frozen")
+    assert first.estimated_hours == profile.estimated_hours
+
+    profile.employment_type = EmploymentType.PART_TIME
+    part_time = estimate_hours_worked(profile)
+    assert part_time is not first and part_time.estimated_hours < first.estimated_hours
+
+    profile.set_estimated_hours(1234)
+    exact = estimate_hours_worked(profile)
+    assert (exact.estimated_hours, exact.confidence) == (1234, "exact")
+    assert estimate_hours_worked(UserProfile()) is None
+
+
+def main() -> None:
+    test_session_store_evicts_least_recent_profile()
+    test_concurrent_first_access_shares_one_profile()
+    test_updates_apply_contract_before_explicit_employer()
+    test_hours_estimate_is_reused_until_inputs_change()
+    print("[OK] User profile tests passed")
+
+
+if __name__ == "__main__":
+    main()
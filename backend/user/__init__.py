@@ -4,6 +4,7 @@ from backend.user.profile import (
     UserProfile,
     EmploymentType,
     HoursEstimate,
+    HoursEstimateWithSteps,
     get_user_profile,
     update_user_profile,
     clear_user_profile,
@@ -16,6 +17,7 @@ __all__ = [
     "UserProfile",
     "EmploymentType",
     "HoursEstimate",
+    "HoursEstimateWithSteps",
     "get_user_profile",
     "update_user_profile",
     "clear_user_profile",
@@ -9,28 +9,71 @@ Stores user context (hire date, classification, employment type) to enable:
 Privacy Note: Profile data is stored in session only, not persisted.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Optional, Literal
 from enum import Enum
+from functools import lru_cache
+import copy
 import math
 import json
 import re
+import threading
 
+from backend.config import USER_PROFILE_MAX_SESSIONS
 from backend.contracts import get_contract_catalog_entry
+from backend.chunk_files import load_json_artifact
 from backend.wage_files import resolve_wage_file
 from backend.classification_ontology_files import resolve_classification_ontology_file
 from backend.role_catalog_files import resolve_role_catalog_file
 from backend.ingest.extract_wages import normalize_classification_name
 
 
+# Employees hired before this date keep grandfathered contract provisions.
+_GRANDFATHER_CUTOFF = date(2005, 3, 27)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_date(value: str) -> date:
+    """Parse an ISO hire date; UIs re-post the same few dates on every edit."""
+    return date.fromisoformat(value)
+
+
 class EmploymentType(str, Enum):
     FULL_TIME = "full_time"
     PART_TIME = "part_time"
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Value -> member, so parsing API input needs no Enum call or ValueError path.
+_EMPLOYMENT_TYPE_BY_VALUE = {member.value: member for member in EmploymentType}
+
+
+def _parse_employment_type(value) -> Optional[EmploymentType]:
+    """EmploymentType for a client value, or None if unknown or not a string."""
+    # Client/session JSON may hold lists or dicts, which are unhashable.
+    if not isinstance(value, str):
+        return None
+    return _EMPLOYMENT_TYPE_BY_VALUE.get(value)
+
+
+def _tenure_hours(months: int, employment_type: "EmploymentType") -> int:
+    """Floor estimate of hours worked over `months` (see UserProfile.estimated_hours)."""
+    # Average weekly hours by employment type
+    if employment_type == EmploymentType.FULL_TIME:
+        avg_weekly_hours = 36
+    elif employment_type == EmploymentType.PART_TIME:
+        avg_weekly_hours = 20
+    else:
+        # Conservative estimate if unknown
+        avg_weekly_hours = 20
+
+    # Calculate: months * weeks_per_month * hours_per_week
+    return int(months * 4.33 * avg_weekly_hours)
+
+
+@dataclass(slots=True)
 class UserProfile:
     """
     User profile for personalized contract queries.
@@ -55,6 +98,8 @@ class UserProfile:
 
     # Cached calculations
     _estimated_hours: Optional[int] = field(default=None, repr=False)
+    # (inputs, HoursEstimate) from the last estimate_hours_worked call
+    _cached_estimate: Optional[tuple] = field(default=None, repr=False, compare=False)
 
     # Profile completeness
     def __post_init__(self):
@@ -112,19 +157,7 @@ class UserProfile:
         if months is None:
             return None
 
-        # Average weekly hours by employment type
-        if self.employment_type == EmploymentType.FULL_TIME:
-            avg_weekly_hours = 36
-        elif self.employment_type == EmploymentType.PART_TIME:
-            avg_weekly_hours = 20
-        else:
-            # Conservative estimate if unknown
-            avg_weekly_hours = 20
-
-        # Calculate: months * weeks_per_month * hours_per_week
-        estimated = int(months * 4.33 * avg_weekly_hours)
-
-        return estimated
+        return _tenure_hours(months, self.employment_type)
 
     def set_estimated_hours(self, hours: int):
         """Allow manual override of hours if user knows exact value."""
@@ -141,8 +174,7 @@ class UserProfile:
         if not self.hire_date:
             return None
 
-        grandfather_date = date(2005, 3, 27)
-        return self.hire_date < grandfather_date
+        return self.hire_date < _GRANDFATHER_CUTOFF
 
     def to_dict(self) -> dict:
         """Serialize profile for API responses."""
@@ -166,16 +198,13 @@ class UserProfile:
         hire_date = None
         if data.get("hire_date"):
             if isinstance(data["hire_date"], str):
-                hire_date = date.fromisoformat(data["hire_date"])
+                hire_date = _parse_iso_date(data["hire_date"])
             elif isinstance(data["hire_date"], date):
                 hire_date = data["hire_date"]
 
         employment_type = EmploymentType.UNKNOWN
         if data.get("employment_type"):
-            try:
-                employment_type = EmploymentType(data["employment_type"])
-            except ValueError:
-                pass
+            employment_type = _parse_employment_type(data["employment_type"]) or employment_type
 
         return cls(
             session_id=data.get("session_id", ""),
@@ -192,28 +221,57 @@ class UserProfile:
 # HOURS ESTIMATOR
 # =============================================================================
 
-@dataclass
+_ROUGH_ESTIMATE_DISCLAIMER = (
+    "This is a rough estimate. Your actual wage depends on total hours worked. "
+    "Check your pay stub or the Company HR Portal for exact figures."
+)
+
+# Disclaimer shown with an hours estimate, by confidence.
+_DISCLAIMERS = {
+    "exact": "",
+    "high": "This is an estimate based on your tenure. Your actual hours may vary.",
+    "medium": _ROUGH_ESTIMATE_DISCLAIMER,
+    "low": _ROUGH_ESTIMATE_DISCLAIMER,
+}
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class HoursEstimate:
     """Result of hours estimation with transparency metadata."""
     estimated_hours: int
     confidence: Literal["exact", "high", "medium", "low"]
     basis: str  # Human-readable explanation
+    # Appropriate disclaimer for the confidence, fixed at construction
+    disclaimer: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "disclaimer", _DISCLAIMERS.get(self.confidence, _ROUGH_ESTIMATE_DISCLAIMER)
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class HoursEstimateWithSteps(HoursEstimate):
+    """Hours estimate placed on a wage progression (estimate_hours_worked never sets steps)."""
     current_step: Optional[str] = None
     next_step: Optional[str] = None
     hours_to_next_step: Optional[int] = None
 
-    @property
-    def disclaimer(self) -> str:
-        """Generate appropriate disclaimer based on confidence."""
-        if self.confidence == "exact":
-            return ""
-        elif self.confidence == "high":
-            return "This is an estimate based on your tenure. Your actual hours may vary."
-        else:
-            return (
-                "This is a rough estimate. Your actual wage depends on total hours worked. "
-                "Check your pay stub or the Company HR Portal for exact figures."
-            )
+
+# Basis templates by employment type, filled with months employed.
+_BASIS_TEMPLATES = {
+    EmploymentType.UNKNOWN: "Based on ~%d months employed, assuming part-time (~20 hrs/week).",
+    EmploymentType.FULL_TIME: "Based on ~%d months full-time (~36 hrs/week average).",
+    EmploymentType.PART_TIME: "Based on ~%d months part-time (~20 hrs/week average).",
+}
+
+
+@lru_cache(maxsize=1024)
+def _estimate_confidence_and_basis(employment_type: EmploymentType, months: int) -> tuple[str, str]:
+    """Confidence and explanation for a tenure-based estimate (few distinct inputs)."""
+    # Determine confidence based on what we know
+    confidence = "low" if employment_type == EmploymentType.UNKNOWN else "medium"
+    return confidence, _BASIS_TEMPLATES[employment_type] % months
 
 
 def estimate_hours_worked(profile: UserProfile) -> Optional[HoursEstimate]:
@@ -221,36 +279,43 @@ def estimate_hours_worked(profile: UserProfile) -> Optional[HoursEstimate]:
     Estimate hours worked with confidence level and transparency.
 
     Returns HoursEstimate with explanation of how it was calculated.
+    The result is memoized on the profile and reused (the same object)
+    while its inputs are unchanged; callers must not mutate it.
     """
-    if profile._estimated_hours is not None:
+    # Read tenure and employment type once; the estimated_hours property
+    # would recompute months_employed.
+    exact_hours = profile._estimated_hours
+    months = profile.months_employed if exact_hours is None else None
+    employment_type = profile.employment_type
+
+    key = (exact_hours, months, employment_type)
+    cached = profile._cached_estimate
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    estimate = _build_hours_estimate(exact_hours, months, employment_type)
+    profile._cached_estimate = (key, estimate)
+    return estimate
+
+
+def _build_hours_estimate(
+    exact_hours: Optional[int],
+    months: Optional[int],
+    employment_type: EmploymentType,
+) -> Optional[HoursEstimate]:
+    if exact_hours is not None:
         return HoursEstimate(
-            estimated_hours=profile._estimated_hours,
+            estimated_hours=exact_hours,
             confidence="exact",
             basis="You provided your exact hours worked."
         )
 
-    if not profile.hire_date:
-        return None
-
-    months = profile.months_employed
-    estimated = profile.estimated_hours
-
-    if estimated is None:
+    if months is None:
         return None
 
-    # Determine confidence based on what we know
-    if profile.employment_type == EmploymentType.UNKNOWN:
-        confidence = "low"
-        basis = f"Based on ~{months} months employed, assuming part-time (~20 hrs/week)."
-    elif profile.employment_type == EmploymentType.FULL_TIME:
-        confidence = "medium"
-        basis = f"Based on ~{months} months full-time (~36 hrs/week average)."
-    else:
-        confidence = "medium"
-        basis = f"Based on ~{months} months part-time (~20 hrs/week average)."
+    confidence, basis = _estimate_confidence_and_basis(employment_type, months)
 
     return HoursEstimate(
-        estimated_hours=estimated,
+        estimated_hours=_tenure_hours(months, employment_type),
         confidence=confidence,
         basis=basis
     )
@@ -260,15 +325,42 @@ def estimate_hours_worked(profile: UserProfile) -> Optional[HoursEstimate]:
 # SESSION PROFILE STORAGE
 # =============================================================================
 
-# In-memory storage for session profiles
-_session_profiles: dict[str, UserProfile] = {}
+# In-memory storage for session profiles. Sessions are spread over shards,
+# each an LRU (least recently used first) guarded by its own lock, so
+# concurrent requests for one session see a single profile while requests
+# for different sessions rarely contend.
+_SESSION_SHARD_COUNT = 16
+_session_shards = [
+    (threading.RLock(), OrderedDict()) for _ in range(_SESSION_SHARD_COUNT)
+]
+
+
+# Blank profile copied for new sessions. UserProfile.__init__ runs
+# __post_init__, which scans the contract catalog even for an empty
+# contract_id; a shallow copy skips that (every field is immutable).
+_PROFILE_PROTOTYPE = UserProfile()
+
+
+def _session_shard(session_id: str) -> tuple:
+    """(lock, profiles) shard holding `session_id`."""
+    return _session_shards[hash(session_id) % len(_session_shards)]
 
 
 def get_user_profile(session_id: str) -> UserProfile:
     """Get or create user profile for session."""
-    if session_id not in _session_profiles:
-        _session_profiles[session_id] = UserProfile(session_id=session_id)
-    return _session_profiles[session_id]
+    lock, profiles = _session_shard(session_id)
+    with lock:
+        profile = profiles.get(session_id)
+        if profile is not None:
+            profiles.move_to_end(session_id)
+            return profile
+        profile = copy.copy(_PROFILE_PROTOTYPE)
+        profile.session_id = session_id
+        profiles[session_id] = profile
+        shard_capacity = max(1, -(-USER_PROFILE_MAX_SESSIONS // len(_session_shards)))
+        while len(profiles) > shard_capacity:
+            profiles.popitem(last=False)
+        return profile
 
 
 def _normalize_profile_classification_value(
@@ -311,47 +403,78 @@ def _normalize_profile_classification_value(
 
 def update_user_profile(session_id: str, updates: dict) -> UserProfile:
     """Update user profile with new data."""
-    profile = get_user_profile(session_id)
+    lock, _ = _session_shard(session_id)
+    with lock:
+        return _apply_profile_updates(get_user_profile(session_id), updates)
 
-    if "contract_id" in updates:
-        profile.contract_id = updates["contract_id"]
-        meta = get_contract_catalog_entry(profile.contract_id)
-        if meta:
-            # Keep profile context aligned with selected contract.
-            profile.union_local = meta.get("union_local_id", profile.union_local)
-            profile.employer = meta.get("employer", profile.employer)
-
-    if "classification" in updates:
-        profile.classification = _normalize_profile_classification_value(
-            updates["classification"],
-            contract_id=profile.contract_id,
-        )
 
-    if "employment_type" in updates:
-        try:
-            profile.employment_type = EmploymentType(updates["employment_type"])
-        except ValueError:
-            pass
+def _update_contract_id(profile: UserProfile, value) -> None:
+    profile.contract_id = value
+    meta = get_contract_catalog_entry(profile.contract_id)
+    if meta:
+        # Keep profile context aligned with selected contract.
+        profile.union_local = meta.get("union_local_id", profile.union_local)
+        profile.employer = meta.get("employer", profile.employer)
+
+
+def _update_classification(profile: UserProfile, value) -> None:
+    profile.classification = _normalize_profile_classification_value(
+        value,
+        contract_id=profile.contract_id,
+    )
+
+
+def _update_employment_type(profile: UserProfile, value) -> None:
+    employment_type = _parse_employment_type(value)
+    if employment_type is not None:
+        profile.employment_type = employment_type
+
 
-    if "hire_date" in updates:
-        if isinstance(updates["hire_date"], str):
-            profile.hire_date = date.fromisoformat(updates["hire_date"])
-        elif isinstance(updates["hire_date"], date):
-            profile.hire_date = updates["hire_date"]
+def _update_hire_date(profile: UserProfile, value) -> None:
+    if isinstance(value, str):
+        profile.hire_date = _parse_iso_date(value)
+    elif isinstance(value, date):
+        profile.hire_date = value
 
-    if "exact_hours" in updates:
-        profile.set_estimated_hours(int(updates["exact_hours"]))
 
-    if "employer" in updates:
-        profile.employer = updates["employer"]
+def _update_exact_hours(profile: UserProfile, value) -> None:
+    profile.set_estimated_hours(int(value))
 
+
+def _update_employer(profile: UserProfile, value) -> None:
+    profile.employer = value
+
+
+# Update handlers by key, in application order: contract_id first (it sets
+# the employer default and scopes classification normalization), an
+# explicit employer last.
+_PROFILE_UPDATE_HANDLERS = {
+    "contract_id": _update_contract_id,
+    "classification": _update_classification,
+    "employment_type": _update_employment_type,
+    "hire_date": _update_hire_date,
+    "exact_hours": _update_exact_hours,
+    "employer": _update_employer,
+}
+_PROFILE_UPDATE_ORDER = {key: rank for rank, key in enumerate(_PROFILE_UPDATE_HANDLERS)}
+
+
+def _apply_profile_updates(profile: UserProfile, updates: dict) -> UserProfile:
+    """Apply API/UI field updates to `profile` (caller holds its shard lock)."""
+    # Partial edits touch one or two keys: visit only the keys present.
+    keys = [key for key in updates if key in _PROFILE_UPDATE_HANDLERS]
+    if len(keys) > 1:
+        keys.sort(key=_PROFILE_UPDATE_ORDER.__getitem__)
+    for key in keys:
+        _PROFILE_UPDATE_HANDLERS[key](profile, updates[key])
     return profile
 
 
 def clear_user_profile(session_id: str):
     """Clear profile data for session."""
-    if session_id in _session_profiles:
-        del _session_profiles[session_id]
+    lock, profiles = _session_shard(session_id)
+    with lock:
+        profiles.pop(session_id, None)
 
 
 # =============================================================================
@@ -379,6 +502,12 @@ CLASSIFICATION_DISPLAY_NAMES = {
     "other_assistant_managers": "Other Assistant Managers",
 }
 
+# Static fallback options, built once. Like the per-contract cached lists,
+# this list is shared between callers and must not be mutated.
+_LEGACY_CLASSIFICATION_OPTIONS = [
+    {"value": key, "label": label} for key, label in CLASSIFICATION_DISPLAY_NAMES.items()
+]
+
 
 _classification_cache_by_contract: dict[str, list[dict]] = {}
 _AMBIGUOUS_ROLE_VALUE_HINTS = {
@@ -647,8 +776,7 @@ def _load_contract_classification_options_from_wages(contract_id: str) -> list[d
         return []
 
     try:
-        with open(wages_file, "r", encoding="utf-8") as f:
-            wages_data = json.load(f)
+        wages_data = load_json_artifact(wages_file)
     except Exception:
         return []
 
@@ -961,7 +1089,7 @@ def get_classification_options(
             filtered = [o for o in options if o.get("wage_available", True)]
             return filtered or options
 
-    return [{"value": key, "label": label} for key, label in CLASSIFICATION_DISPLAY_NAMES.items()]
+    return _LEGACY_CLASSIFICATION_OPTIONS
 
 
 def resolve_classification_display_name(